@@ -83,7 +83,7 @@ if %REBUILD% equ 1 (
       set "COPY_METADATA=%COPY_METADATA%"
     )
 
-    pyinstaller --hidden-import win32timezone --hidden-import pydantic.deprecated.decorator --hidden-import torch --hidden-import torchvision --hidden-import tiktoken_ext.openai_public --hidden-import tiktoken_ext --hidden-import langchain_community %HIDDEN_IMPORTS% --collect-data langchain_community --collect-data torch --collect-data torchvision --collect-data langchain --collect-data pypdf --collect-data docling --collect-data pypdfium2 --collect-data pypdfium2_raw --collect-data docling_core --collect-all chromadb --collect-data docling_parse --copy-metadata torch --copy-metadata langchain_community --copy-metadata langchain --copy-metadata torchvision --copy-metadata packaging --copy-metadata safetensors --copy-metadata regex --copy-metadata huggingface-hub --copy-metadata tokenizers --copy-metadata filelock --copy-metadata numpy --copy-metadata tqdm --copy-metadata requests --copy-metadata pyyaml --copy-metadata docling --copy-metadata pypdf --copy-metadata pypdfium2 --copy-metadata docling_core --copy-metadata docling_parse --icon %CD%\res\logo\logo.ico --log-level DEBUG --clean --noconfirm --onefile src\windows_service.py
+    pyinstaller --hidden-import win32timezone --hidden-import pydantic.deprecated.decorator --hidden-import torch --hidden-import torchvision --hidden-import tiktoken_ext.openai_public --hidden-import tiktoken_ext --hidden-import langchain_community %HIDDEN_IMPORTS% --collect-data langchain_community --collect-data torch --collect-data torchvision --collect-data langchain --collect-data pypdf --collect-data docling --collect-data pypdfium2 --collect-data pypdfium2_raw --collect-data docling_core --collect-data docling_parse --copy-metadata torch --copy-metadata langchain_community --copy-metadata langchain --copy-metadata torchvision --copy-metadata packaging --copy-metadata safetensors --copy-metadata regex --copy-metadata huggingface-hub --copy-metadata tokenizers --copy-metadata filelock --copy-metadata numpy --copy-metadata tqdm --copy-metadata requests --copy-metadata pyyaml --copy-metadata docling --copy-metadata pypdf --copy-metadata pypdfium2 --copy-metadata docling_core --copy-metadata docling_parse --icon %CD%\res\logo\logo.ico --log-level DEBUG --clean --noconfirm --onefile src\windows_service.py
     if %ERRORLEVEL% neq 0 (
         echo PyInstaller build failed.
         exit /b %ERRORLEVEL%
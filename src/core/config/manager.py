@@ -54,24 +54,18 @@ class ConfigManager:
         logger.debug("Accessing operation lock for save_config")
         with self._operation_lock:
             try:
-                logger.debug(f"Saving config '{config_name}'")
-                existing_config = self.db_client.find_one(
-                    {"config_name": config_name}
+                logger.debug("Saving config '%s'", config_name)
+                # A single upsert is atomic in the database, also against the other processes, unlike looking the
+                # config up and then inserting it
+                result = self.db_client.update_one(
+                    {"config_name": config_name},
+                    {"$set": config_data},
+                    upsert=True,
                 )
-
-                if existing_config:
-                    logger.debug(f"Updating existing config '{config_name}'")
-                    return (
-                        self.db_client.update_one(
-                            {"config_name": config_name}, {"$set": config_data}
-                        ).modified_count
-                        > 0
-                    )
-                else:
-                    logger.debug(f"Creating new config '{config_name}'")
-                    config_data["config_name"] = config_name
-                    self.db_client.insert_one(config_data)
+                if result.upserted_id is not None:
+                    logger.debug("Created new config '%s'", config_name)
                     return True
+                return result.modified_count > 0
             except Exception as e:
                 logger.error(f"Error saving config '{config_name}': {str(e)}")
                 return False
@@ -90,11 +84,11 @@ class ConfigManager:
         logger.debug("Accessing operation lock for load_config")
         with self._operation_lock:
             try:
-                logger.debug(f"Loading config '{config_name}'")
+                logger.debug("Loading config '%s'", config_name)
                 config = self.db_client.find_one({"config_name": config_name})
 
                 if config:
-                    logger.debug(f"Config '{config_name}' found")
+                    logger.debug("Config '%s' found", config_name)
                     del config["config_name"]
                     if not return_id:
                         del config["_id"]
@@ -116,14 +110,16 @@ class ConfigManager:
         logger.debug("Accessing operation lock for delete_config")
         with self._operation_lock:
             try:
-                logger.debug(f"Deleting config '{config_name}'")
+                logger.debug("Deleting config '%s'", config_name)
                 result = self.db_client.delete_one(
                     {"config_name": config_name}
                 ).deleted_count
                 if result > 0:
-                    logger.debug(f"Config '{config_name}' successfully deleted")
+                    logger.debug(
+                        "Config '%s' successfully deleted", config_name
+                    )
                 else:
-                    logger.debug(f"Config '{config_name}' not found")
+                    logger.debug("Config '%s' not found", config_name)
                 return result > 0
             except Exception as e:
                 logger.error(f"Error deleting config '{config_name}': {str(e)}")
@@ -143,7 +139,7 @@ class ConfigManager:
                     doc["config_name"]
                     for doc in self.db_client.find({}, {"config_name": 1})
                 ]
-                logger.debug(f"Found {len(configs)} configs")
+                logger.debug("Found %s configs", len(configs))
                 return configs
             except Exception as e:
                 logger.error(f"Error listing configs: {str(e)}")
@@ -161,11 +157,11 @@ class ConfigManager:
         """
         logger.debug("Accessing operation lock for update_config_key")
         try:
-            logger.debug(f"Updating key '{key}' in config '{config_name}'")
+            logger.debug("Updating key '%s' in config '%s'", key, config_name)
             config = self.load_config(config_name)
 
             if config is None:
-                logger.debug(f"Config '{config_name}' not found")
+                logger.debug("Config '%s' not found", config_name)
                 return False
 
             config[key] = value
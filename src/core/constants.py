@@ -16,6 +16,8 @@ DATA_DIR = (
 LOGGING_DIR = os.path.join(DATA_DIR, "logs")
 HTML_DIR = os.path.join(DATA_DIR, "html")
 JSON_DIR = os.path.join(DATA_DIR, "json")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+EMBEDDINGS_CACHE_PATH = os.path.join(CACHE_DIR, "embeddings.sqlite")
 
 LOGGING_ONLY_CONSOLE = "LOGGING_ONLY_CONSOLE"
 LINKEDIN_ASSISTANT_LOGGING_LEVEL = "LINKEDIN_ASSISTANT_LOGGING_LEVEL"
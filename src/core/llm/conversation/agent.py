@@ -2,6 +2,7 @@ import base64
 import copy
 import json
 import logging
+import threading
 import uuid
 from typing import Any, Dict, List, Optional, Union
 import requests
@@ -51,6 +52,8 @@ class LangChainGPT:
             None  # Unique ID for each conversation
         )
         self.apply_unicode_bold: bool = True  # Flag to toggle bold formatting
+        # Serializes agent invocations, as they read and write the conversation checkpoints
+        self._invoke_lock = threading.Lock()
         self.max_conversation_length: Optional[int] = None
         self.max_tokens: Optional[int] = None
         self.trimming_strategy: Optional[str] = None
@@ -181,20 +184,26 @@ class LangChainGPT:
         if builtin_tools:
             self.tools.extend(load_tools(builtin_tools))
 
-    def _invoke(self, messages: Dict[str, Any]) -> Union[dict[str, Any], Any]:
+    def _invoke(
+        self, messages: Dict[str, Any], conversation_id: Optional[str] = None
+    ) -> Union[dict[str, Any], Any]:
         """Invoke the ReAct agent with the given messages.
 
-        :param: The input data for the graph.
+        :param: messages: The input data for the graph.
+        :param: conversation_id: Conversation (thread) to invoke the agent on. Defaults to the current one.
         :returns: The output of the graph run. If stream_mode is "values", it returns the latest output.
             If stream_mode is not "values", it returns a list of output chunks.
         """
-        # Ensure the conversation ID is set
-        if not self.conversation_id:
-            self.conversation_id = str(uuid.uuid4())
-
-        return self.agent.invoke(
-            messages, {"configurable": {"thread_id": self.conversation_id}}
-        )
+        if not conversation_id:
+            # Ensure the conversation ID is set
+            if not self.conversation_id:
+                self.conversation_id = str(uuid.uuid4())
+            conversation_id = self.conversation_id
+
+        with self._invoke_lock:
+            return self.agent.invoke(
+                messages, {"configurable": {"thread_id": conversation_id}}
+            )
 
     def _format_response(self, messages: Dict[str, Any]) -> str:
         """Format the agent's response for output.
@@ -267,12 +276,17 @@ class LangChainGPT:
         return messages
 
     def call(
-        self, input_message: str, images: Optional[List[bytes]] = None
+        self,
+        input_message: str,
+        images: Optional[List[bytes]] = None,
+        conversation_id: Optional[str] = None,
     ) -> str:
         """
         Call the agent to process the input message.
         :param input_message: The input string for the agent.
         :param images: Optional list of images as input.
+        :param conversation_id: Optional conversation to respond on. Defaults to the current conversation. Passing it
+            lets callers snapshot the conversation and not hold any lock for the length of the call.
 
         :return: Agent response.
         """
@@ -295,5 +309,8 @@ class LangChainGPT:
 
         # Invoke the agent and return the formatted response
         return self._format_response(
-            self._invoke({"messages": [("user", input_message_payload)]})
+            self._invoke(
+                {"messages": [("user", input_message_payload)]},
+                conversation_id,
+            )
         )
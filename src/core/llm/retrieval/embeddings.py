@@ -0,0 +1,216 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+import numpy as np
+from cachetools import LRUCache
+from langchain_core.embeddings import Embeddings
+from src.core.constants import EMBEDDINGS_CACHE_PATH
+
+# In-memory tier of the cache, shared by every CachedEmbeddings instance (a workflow, and so an instance, is built per
+# document). Keyed by (provider, model, quantization, hash), it holds the decoded vectors, as SQLite would return them
+_l1 = LRUCache(maxsize=4096)
+_l1_lock = threading.Lock()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings adapter that stores document embeddings in a persistent SQLite cache keyed by
+    (embeddings provider, model, sha256(text)). Only the texts that miss the cache are sent to the underlying
+    embeddings model, so re-processing a document (or documents sharing boilerplate) costs disk reads instead of
+    API calls. An in-memory LRU, shared by every instance, sits on top of the SQLite table.
+
+    Vectors are stored quantized: "float16" halves the footprint with negligible loss for cosine similarity, while
+    "int8" (symmetric, one float32 scale per vector) cuts it to a quarter. Vectors older than _MAX_AGE are pruned
+    whenever the cache is opened, so the file does not grow with every document ever processed.
+    """
+
+    _TABLE_SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS emb_cache ("
+        "provider TEXT NOT NULL, "
+        "model TEXT NOT NULL, "
+        "hash TEXT NOT NULL, "
+        "quantization TEXT NOT NULL, "
+        "vector BLOB NOT NULL, "
+        "created_at REAL NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (provider, model, hash, quantization))"
+    )
+    _MAX_AGE = 30 * 24 * 3600  # Seconds a cached vector is kept
+    _QUANTIZATIONS = ("float16", "int8")
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        provider: str,
+        cache_path: str = EMBEDDINGS_CACHE_PATH,
+        quantization: str = "float16",
+    ):
+        """
+        :param embeddings: Underlying embeddings model to call on cache misses
+        :param provider: Embeddings provider config name, part of the cache key
+        :param cache_path: Path of the SQLite file backing the cache
+        :param quantization: Storage format of the cached vectors, either "float16" or "int8"
+        """
+        if quantization not in self._QUANTIZATIONS:
+            raise ValueError(
+                f"Quantization {quantization} is not supported. Expected one of {self._QUANTIZATIONS}"
+            )
+        self.quantization = quantization
+        self.embeddings = embeddings
+        self.provider = provider
+        self.model = str(
+            getattr(embeddings, "model", None)
+            or getattr(embeddings, "model_name", "")
+        )
+        self.cache_path = cache_path
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.execute(self._TABLE_SCHEMA)
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(emb_cache)")
+            }
+            if "created_at" not in columns:
+                # Caches written before the column existed. Their rows get 0, so they are pruned right away
+                conn.execute(
+                    "ALTER TABLE emb_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS emb_cache_created_at ON emb_cache (created_at)"
+            )
+            conn.execute(
+                "DELETE FROM emb_cache WHERE created_at < ?",
+                (time.time() - self._MAX_AGE,),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.cache_path, timeout=30)
+        try:
+            with conn:  # Commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _encode(self, vector: List[float]) -> bytes:
+        if self.quantization == "float16":
+            return np.asarray(vector, dtype=np.float16).tobytes()
+        vector = np.asarray(vector, dtype=np.float32)
+        scale = np.float32(np.abs(vector).max() / 127 or 1)
+        return (
+            scale.tobytes() + np.round(vector / scale).astype(np.int8).tobytes()
+        )
+
+    def _decode(self, blob: bytes) -> List[float]:
+        if self.quantization == "float16":
+            vector = np.frombuffer(blob, dtype=np.float16)
+        else:
+            scale = np.frombuffer(blob[:4], dtype=np.float32)[0]
+            vector = np.frombuffer(blob[4:], dtype=np.int8) * scale
+        return vector.astype(np.float32).tolist()
+
+    def _l1_key(self, h: str) -> tuple:
+        return self.provider, self.model, self.quantization, h
+
+    def _load(self, hashes: List[str]) -> dict:
+        """
+        Fetch the cached vectors for the given hashes, first from the in-memory LRU and then from SQLite.
+
+        :param hashes: Content hashes to look up
+        :return: dict mapping hash to embedding vector for every hit
+        """
+        with _l1_lock:
+            found = {
+                h: vector
+                for h in hashes
+                if (vector := _l1.get(self._l1_key(h))) is not None
+            }
+        missing = [h for h in hashes if h not in found]
+        if not missing:
+            return found
+
+        with self._connect() as conn:
+            # SQLite caps the number of bound parameters per statement
+            for i in range(0, len(missing), 500):
+                batch = missing[i : i + 500]
+                rows = conn.execute(
+                    "SELECT hash, vector FROM emb_cache WHERE provider=? AND model=? "
+                    f"AND quantization=? AND hash IN ({','.join('?' * len(batch))})",
+                    (self.provider, self.model, self.quantization, *batch),
+                ).fetchall()
+                for h, blob in rows:
+                    found[h] = self._decode(blob)
+        with _l1_lock:
+            _l1.update(
+                (self._l1_key(h), found[h]) for h in missing if h in found
+            )
+        return found
+
+    def _store(self, entries: dict) -> dict:
+        """
+        Persist newly computed vectors.
+
+        :param entries: dict mapping hash to embedding vector
+        :return: dict mapping hash to the vector as stored, so that a text gets the same vector whether it was just
+            computed or read from the cache
+        """
+        encoded = {h: self._encode(vector) for h, vector in entries.items()}
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO emb_cache "
+                "(provider, model, hash, quantization, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (self.provider, self.model, h, self.quantization, blob, now)
+                    for h, blob in encoded.items()
+                ],
+            )
+        stored = {h: self._decode(blob) for h, blob in encoded.items()}
+        with _l1_lock:
+            _l1.update(
+                (self._l1_key(h), vector) for h, vector in stored.items()
+            )
+        return stored
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of documents, only calling the underlying model for the texts that are not cached.
+
+        :param texts: Texts to embed
+        :return: List of embeddings in the same order as the input texts
+        """
+        hashes = [self._hash(text) for text in texts]
+        vectors = self._load(hashes)
+
+        pending: dict[str, str] = {}
+        for h, text in zip(hashes, texts):
+            if h not in vectors:
+                pending.setdefault(h, text)
+
+        if pending:
+            computed = dict(
+                zip(
+                    pending.keys(),
+                    self.embeddings.embed_documents(list(pending.values())),
+                )
+            )
+            vectors.update(self._store(computed))
+
+        return [vectors[h] for h in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Queries are not cached, as some providers embed them differently from documents.
+
+        :param text: Query text
+        :return: Query embedding
+        """
+        return self.embeddings.embed_query(text)
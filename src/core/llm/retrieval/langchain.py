@@ -1,21 +1,84 @@
 import logging
+import threading
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from langchain.chains.summarize import load_summarize_chain
 from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
-from langgraph.graph import StateGraph, START, END
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import Chroma
 from langchain.prompts import PromptTemplate
-from typing import TypedDict, List, Optional
+from typing import Callable, Iterable, TypedDict, List, Optional, Tuple
 from typing_extensions import Required, NotRequired
+from src.core.llm.retrieval.embeddings import CachedEmbeddings
 from src.core.llm.retrieval.rag import DocumentInformationRetrieval
+from src.core.llm.retrieval.vectorstore import FlatVectorStore
 from src.core.llm.provider import LLMProvider
 from src.core.utils.logging import ServiceLogger
 
+try:
+    import tiktoken
+except ImportError:  # Optional, only used to count tokens precisely
+    tiktoken = None
+
+_CHARS_PER_TOKEN = 4  # Rough estimate used when tiktoken is not available
+_MAX_CHARS_PER_TOKEN = (
+    16  # Generous characters per token bound, to avoid encoding whole documents
+)
+_TITLE_CONTEXT_TOKENS = (
+    500  # Tokens from the start of the text used to extract the title
+)
+_CLIENTS_TTL = 3600  # Seconds a client is reused before rebuilding it (picks up config and key changes)
+
+# LLM and embeddings clients shared by every workflow, keyed by provider config name. Reusing them keeps their HTTP
+# connection pools warm across documents
+_clients = TTLCache(maxsize=16, ttl=_CLIENTS_TTL)
+_clients_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def get_client(config_name: str):
+    """
+    Get the shared LLM or embeddings client for a provider config, building it on first use.
+
+    :param config_name: Provider config name, as accepted by LLMProvider.build
+    :return: The client instance
+    """
+    with _clients_lock:
+        client = _clients.get(config_name)
+        if client is None:
+            client = _clients[config_name] = LLMProvider.build(config_name)
+        return client
+
+
+def truncate_to_tokens(text: str, max_tokens: Optional[int]) -> str:
+    """
+    Truncate a text so that it does not exceed the given number of tokens.
+
+    :param text: Text to truncate
+    :param max_tokens: Maximum number of tokens. If None, the text is returned as is
+    :return: The truncated text
+    """
+    if not max_tokens:
+        return text
+    if tiktoken is None:
+        return text[: max_tokens * _CHARS_PER_TOKEN]
+    # Only a prefix is encoded. The result stays within budget even if the bound is ever exceeded
+    text = text[: max_tokens * _MAX_CHARS_PER_TOKEN]
+    encoding = _get_encoding()
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
 
 class ProcessingState(TypedDict, total=False):
     # Define the structure of the state that flows through the workflow.
-    text: Required[str]  # Input text to be processed
+    paragraphs: Required[List[str]]  # Input paragraphs to be processed
     chunks: NotRequired[List[str]]  # List of text chunks after splitting
     documents: NotRequired[
         List[Document]
@@ -25,7 +88,7 @@ class ProcessingState(TypedDict, total=False):
         List[str]
     ]  # List of terms or questions generated
     vectorstore: NotRequired[
-        Optional[Chroma]
+        Optional[FlatVectorStore]
     ]  # Vectorstore for similarity search
     relevant_chunks: NotRequired[List[str]]  # List of relevant chunks retrieved
     answers: NotRequired[List[str]]  # List of answers generated for questions
@@ -36,6 +99,11 @@ class ProcessingState(TypedDict, total=False):
 class RetrieverWorkflow:
     """Encapsulates the workflow setup and execution for a retriever."""
 
+    _MAX_CONCURRENCY = 10  # Maximum number of concurrent LLM calls per step
+    _MIN_CHUNK_RATIO = (
+        0.25  # Chunks under this fraction of chunk_size get merged
+    )
+
     def __init__(
         self,
         chunk_size,
@@ -47,19 +115,57 @@ class RetrieverWorkflow:
         answer_prompt,
         title_extraction_prompt,
         has_title=False,
+        max_context_tokens=None,
+        embeddings_cache_quantization="float16",
         logger: logging.Logger = ServiceLogger(__name__),
     ):
         # Initialize parameters for chunking, LLM provider, embeddings, and result limits.
         self.logger = logger
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.llm = LLMProvider.build(model_provider)
-        self.embedding_model = LLMProvider.build(embeddings_provider)
+        self.llm = get_client(model_provider)
+        self.embedding_model = CachedEmbeddings(
+            get_client(embeddings_provider),
+            provider=embeddings_provider,
+            quantization=embeddings_cache_quantization,
+        )
         self.n_chunk_results = n_chunk_results
         self.has_title = has_title
         self.query_expansion_prompt = query_expansion_prompt
         self.answer_prompt = answer_prompt
         self.title_extraction_prompt = title_extraction_prompt
+        self.max_context_tokens = max_context_tokens
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap
+        )
+        # Chains are built once and reused across every step invocation
+        self.summarize_chain = load_summarize_chain(
+            self.llm, chain_type="stuff"
+        )
+        self.terms_chain = self._build_chain(
+            self.query_expansion_prompt, ["summary"]
+        )
+        self.answer_chain = self._build_chain(
+            self.answer_prompt, ["context", "question"]
+        )
+        self.title_chain = self._build_chain(
+            self.title_extraction_prompt, ["text"]
+        )
+
+    def _build_chain(self, template: str, input_variables: List[str]):
+        """
+        Build a prompt | llm | string parser chain.
+
+        :param template: Prompt template
+        :param input_variables: Variables of the prompt template
+
+        :returns: The chain
+        """
+        return (
+            PromptTemplate(input_variables=input_variables, template=template)
+            | self.llm
+            | StrOutputParser()
+        )
 
     def create_documents(self, state: ProcessingState):
         """
@@ -78,7 +184,7 @@ class RetrieverWorkflow:
                 Document(page_content=chunk, metadata={"chunk_order": idx})
                 for idx, chunk in enumerate(state["chunks"])
             ]
-            self.logger.info(f"Created {len(state['documents'])} documents.")
+            self.logger.info("Created %d documents.", len(state["documents"]))
         except Exception as e:
             self.logger.error(f"Error creating documents: {e}")
             raise
@@ -107,73 +213,134 @@ class RetrieverWorkflow:
             raise
         return state
 
-    def setup_workflow(self):
-        # Set up the workflow graph by defining nodes and their connections.
+    def setup_workflow(
+        self,
+    ) -> List[Callable[[ProcessingState], ProcessingState]]:
+        """
+        Define the processing steps. The workflow is strictly linear, so the steps are plain method calls executed
+        in order by run, without any graph runtime in between. Title extraction is not a step: it only depends on
+        the input paragraphs, so it runs concurrently with the steps (see LangChainRetriever.search).
+
+        :returns: List[Callable]: The ordered processing steps.
+        """
         self.logger.debug("Setting up workflow.")
-        workflow = StateGraph(ProcessingState)
-
-        # Add nodes for processing stages.
-        workflow.add_node("split_text", self.split_text)
-        workflow.add_node("create_documents", self.create_documents)
-        workflow.add_node("summarize_documents", self.summarize_documents)
-        workflow.add_node("generate_terms", self.generate_terms)
-        workflow.add_node("create_vectorstore", self.create_vectorstore)
-        workflow.add_node(
-            "retrieve_relevant_chunks", self.retrieve_relevant_chunks
-        )
-        workflow.add_node("answer_questions", self.answer_questions)
-        workflow.add_node("format_dialog", self.format_dialog)
-
-        if not self.has_title:
-            workflow.add_node("extract_title", self.extract_title)
-
-        # Define edges for workflow execution.
-        workflow.add_edge(START, "split_text")
-        workflow.add_edge("split_text", "create_documents")
-        workflow.add_edge("create_documents", "summarize_documents")
-        workflow.add_edge("summarize_documents", "generate_terms")
-        workflow.add_edge("generate_terms", "create_vectorstore")
-        workflow.add_edge("create_vectorstore", "retrieve_relevant_chunks")
-        workflow.add_edge("retrieve_relevant_chunks", "answer_questions")
-        workflow.add_edge("answer_questions", "format_dialog")
-
-        if not self.has_title:
-            workflow.add_edge("format_dialog", "extract_title")
-            workflow.add_edge("extract_title", END)
-        else:
-            workflow.add_edge("format_dialog", END)
+        steps = [
+            self.split_text,
+            self.create_documents,
+            self.summarize_documents,
+            self.generate_terms,
+            self.create_vectorstore,
+            self.retrieve_relevant_chunks,
+            self.answer_questions,
+            self.format_dialog,
+        ]
         self.logger.debug("Workflow setup complete.")
-        return workflow
+        return steps
+
+    @staticmethod
+    def run(
+        steps: List[Callable[[ProcessingState], ProcessingState]],
+        state: ProcessingState,
+    ) -> ProcessingState:
+        """
+        Run the processing steps over the state.
+
+        :param: steps (List[Callable]): The ordered processing steps, as returned by setup_workflow.
+            state (ProcessingState): The initial state.
+
+        :returns: ProcessingState: The final state.
+        """
+        for step in steps:
+            state = step(state)
+        return state
 
     def split_text(self, state: ProcessingState):
         """
         Split the input text into manageable chunks for processing.
         Process:
-            - Uses the RecursiveCharacterTextSplitter to divide the text into chunks of a defined size.
+            - Uses the RecursiveCharacterTextSplitter to divide each paragraph into chunks of a defined size.
             - Adds overlap between chunks as per the configuration.
+            - Merges undersized chunks (usually produced around separator boundaries) into their neighbours, as long
+              as the merged chunk does not exceed the chunk size. Fewer chunks means fewer embeddings and documents.
+              The overlap between merged chunks of the same paragraph is kept only once.
 
-        :param: state (ProcessingState): The current processing state containing the input text to be split.
+        :param: state (ProcessingState): The current processing state containing the input paragraphs to be split.
 
         :returns: ProcessingState: Updated state with the split chunks stored in the 'chunks' field.
         """
         self.logger.info("Splitting text into chunks.")
         try:
-            splitter = RecursiveCharacterTextSplitter(
-                chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap
+            # Split paragraph by paragraph so the full text is never materialized as a single string
+            state["chunks"] = self._merge_small_chunks(
+                (i, chunk)
+                for i, paragraph in enumerate(state["paragraphs"])
+                for chunk in self.text_splitter.split_text(paragraph)
             )
-            state["chunks"] = splitter.split_text(state["text"])
-            self.logger.info(f"Text split into {len(state['chunks'])} chunks.")
+            self.logger.info("Text split into %d chunks.", len(state["chunks"]))
         except Exception as e:
             self.logger.error(f"Error splitting text: {e}")
             raise
         return state
 
+    def _merge_small_chunks(
+        self, chunks: Iterable[Tuple[int, str]]
+    ) -> List[str]:
+        """
+        Greedily merge chunks smaller than the minimum chunk size with the following ones while the result fits
+        in the chunk size.
+
+        :param chunks: (paragraph index, chunk) pairs, with the chunks as returned by the text splitter
+
+        :returns: List of merged chunks
+        """
+        min_size = int(self.chunk_size * self._MIN_CHUNK_RATIO)
+        merged: List[str] = []
+        last_paragraph = None
+        for paragraph, chunk in chunks:
+            if merged and len(merged[-1]) < min_size:
+                # Chunks of the same paragraph start with the overlap, which the previous chunk already ends with
+                rest = (
+                    self._strip_overlap(merged[-1], chunk)
+                    if paragraph == last_paragraph
+                    else chunk
+                )
+                if len(merged[-1]) + len(rest) + 1 <= self.chunk_size:
+                    if rest:
+                        merged[-1] = f"{merged[-1]} {rest}"
+                    last_paragraph = paragraph
+                    continue
+            merged.append(chunk)
+            last_paragraph = paragraph
+        return merged
+
+    def _strip_overlap(self, previous: str, chunk: str) -> str:
+        """
+        Remove from the start of a chunk the text it repeats from the end of the previous one, as the text splitter
+        adds up to chunk_overlap characters of overlap. Only whole words are matched, so that a chunk is never cut
+        in the middle of a word.
+
+        :param previous: Chunk preceding the given one in the same paragraph
+        :param chunk: Chunk to strip
+
+        :returns: The chunk without the overlap
+        """
+        for size in range(
+            min(self.chunk_overlap, len(previous), len(chunk)), 0, -1
+        ):
+            if (
+                previous.endswith(chunk[:size])
+                and (size == len(previous) or previous[-size - 1].isspace())
+                and (size == len(chunk) or chunk[size].isspace())
+            ):
+                return chunk[size:].lstrip()
+        return chunk
+
     def summarize_documents(self, state: ProcessingState):
         """
         Generate a summary of the input documents using a language model.
         Process:
             - Splits the list of documents into manageable chunks based on the configured chunk size.
-            - Invokes the language model chain to process each chunk and generate partial summaries.
+            - Invokes the language model chain concurrently on each chunk to generate partial summaries.
             - Concatenates partial summaries into a single cohesive summary.
 
         :param: state (ProcessingState): The current processing state containing the list of documents to summarize.
@@ -182,11 +349,14 @@ class RetrieverWorkflow:
         """
         self.logger.info("Summarizing documents.")
         try:
-            chain = load_summarize_chain(self.llm, chain_type="stuff")
-            summaries = [
-                chain.invoke(state["documents"][i : i + self.chunk_size])
+            groups = [
+                state["documents"][i : i + self.chunk_size]
                 for i in range(0, len(state["documents"]), self.chunk_size)
             ]
+            # Partial summaries are independent, so they are generated concurrently
+            summaries = self.summarize_chain.batch(
+                groups, config={"max_concurrency": self._MAX_CONCURRENCY}
+            )
             state["summary"] = "\n".join(
                 s.get("output_text", "") for s in summaries
             )
@@ -210,20 +380,24 @@ class RetrieverWorkflow:
         """
         self.logger.info("Generating terms or questions from summary.")
         try:
-            chain = (
-                PromptTemplate(
-                    input_variables=["summary"],
-                    template=self.query_expansion_prompt,
-                )
-                | self.llm
-                | StrOutputParser()
-            )
-
             state["terms_or_questions_list"] = (
-                chain.invoke({"summary": state["summary"]}).strip().split("\n")
+                self.terms_chain.invoke(
+                    {
+                        "summary": truncate_to_tokens(
+                            state["summary"], self.max_context_tokens
+                        )
+                    }
+                )
+                .strip()
+                .split("\n")
             )
             self.logger.info(
-                f"Generated terms/questions: {state['terms_or_questions_list']}"
+                "Generated %d terms/questions.",
+                len(state["terms_or_questions_list"]),
+            )
+            self.logger.debug(
+                "Generated terms/questions: %s",
+                state["terms_or_questions_list"],
             )
         except Exception as e:
             self.logger.error(f"Error generating terms: {e}")
@@ -236,7 +410,7 @@ class RetrieverWorkflow:
         Process:
             - Extracts the text content and metadata from the documents in the state.
             - Uses the configured embeddings provider to compute embeddings for the document texts.
-            - Creates a Chroma vector store to enable fast similarity searches.
+            - Creates an in-memory flat vector store to enable fast similarity searches.
 
         :param: state (ProcessingState): The current processing state containing the documents to be converted
             into a vector store.
@@ -245,12 +419,10 @@ class RetrieverWorkflow:
         """
         self.logger.info("Creating vector store from documents.")
         try:
-            state["vectorstore"] = Chroma.from_texts(
+            state["vectorstore"] = FlatVectorStore.from_texts(
                 [doc.page_content for doc in state["documents"]],
                 embedding=self.embedding_model,
                 metadatas=[doc.metadata for doc in state["documents"]],
-                collection_name="retrieval_state",
-                persist_directory=None,
             )
             self.logger.info("Vectorstore created.")
         except Exception as e:
@@ -262,8 +434,9 @@ class RetrieverWorkflow:
         """
         Retrieve relevant chunks of text using similarity search in the vector store.
         Process:
-            - The method iterates through the terms or questions provided in the state.
-            - It uses the vector store to perform a similarity search for each term or question.
+            - Duplicated terms or questions are removed.
+            - The terms or questions are embedded as queries, concurrently (bounded by _MAX_CONCURRENCY), and the
+              vector store is queried once with all the embeddings.
             - The results are de-duplicated while preserving their order.
 
         :param: state (ProcessingState): The current processing state containing the vector store and query terms
@@ -273,24 +446,38 @@ class RetrieverWorkflow:
         """
         self.logger.info("Retrieving relevant chunks from vectorstore.")
         try:
-            results = [
-                chunk
-                for term in state["terms_or_questions_list"]
-                for chunk in state["vectorstore"].similarity_search(
-                    term, k=self.n_chunk_results
+            terms = list(dict.fromkeys(state["terms_or_questions_list"]))
+            vectorstore = state["vectorstore"]
+            # Embedded through the query path: some providers embed queries differently, and the one-off terms are
+            # not worth persisting in the embeddings cache
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(len(terms), self._MAX_CONCURRENCY))
+            ) as executor:
+                query_vectors = list(
+                    executor.map(self.embedding_model.embed_query, terms)
                 )
-            ]
-            # We sort the retrieved documents to facilitate understanding
-            results.sort(key=lambda page: page.metadata["chunk_order"])
-            # We removed duplicated returned chunks
-            results = {page.metadata["chunk_order"]: page for page in results}
-            # Take just the strings
+            # Duplicates between terms are removed by id, texts are only resolved once
+            ids = {
+                i
+                for term_ids in vectorstore.search_ids_by_vectors(
+                    query_vectors, k=self.n_chunk_results
+                )
+                for i in term_ids
+            }
+            # We sort the retrieved chunks to facilitate understanding
             state["relevant_chunks"] = [
-                page.page_content for page in results.values()
-            ]  # Preserve order while ensuring uniqueness.
+                vectorstore.texts[i]
+                for i in sorted(
+                    ids, key=lambda i: vectorstore.metadatas[i]["chunk_order"]
+                )
+            ]
             self.logger.info(
-                f"Retrieved {len(state['relevant_chunks'])} relevant chunks."
+                "Retrieved %d relevant chunks.", len(state["relevant_chunks"])
             )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Relevant chunks:\n%s", "\n".join(state["relevant_chunks"])
+                )
         except Exception as e:
             self.logger.error(f"Error retrieving relevant chunks: {e}")
             raise
@@ -301,7 +488,8 @@ class RetrieverWorkflow:
         Generate answers to a list of questions using the retrieved relevant chunks.
         Process:
             - The method takes the list of relevant chunks and questions from the state.
-            - It uses a language model to provide an answer for each question based on the provided context.
+            - It uses a language model to provide an answer for each question based on the provided context. Questions
+              are answered concurrently, bounded by _MAX_CONCURRENCY to respect provider rate limits.
             - The generated answers are stored in the state for further use.
 
         :param: state (ProcessingState): The current processing state containing questions and relevant chunks.
@@ -311,53 +499,65 @@ class RetrieverWorkflow:
         """
         self.logger.info("Answering questions.")
         try:
-            chain = (
-                PromptTemplate(
-                    input_variables=["context", "question"],
-                    template=self.answer_prompt,
-                )
-                | self.llm
-                | StrOutputParser()
+            # All relevant chunks go in a single call per question, truncated only if they exceed the context budget
+            context = truncate_to_tokens(
+                "\n".join(state["relevant_chunks"]), self.max_context_tokens
+            )
+            # Questions are independent, so they are answered concurrently. Batch keeps the output order
+            state["answers"] = self.answer_chain.batch(
+                [
+                    {"context": context, "question": question}
+                    for question in state["terms_or_questions_list"]
+                ],
+                config={"max_concurrency": self._MAX_CONCURRENCY},
             )
-
-            state["answers"] = [
-                chain.invoke(
-                    {
-                        "context": "\n".join(state["relevant_chunks"]),
-                        "question": question,
-                    }
-                )
-                for question in state["terms_or_questions_list"]
-            ]
             self.logger.info("Questions answered.")
         except Exception as e:
             self.logger.error(f"Error answering questions: {e}")
             raise
         return state
 
+    @staticmethod
+    def _leading_text(paragraphs: List[str], max_chars: int) -> str:
+        """
+        Join only the leading paragraphs needed to reach max_chars characters.
+
+        :param: paragraphs (List[str]): Document paragraphs.
+            max_chars (int): Number of characters after which the remaining paragraphs are skipped.
+
+        :returns: str: The leading text of the document.
+        """
+        leading, length = [], 0
+        for paragraph in paragraphs:
+            if length >= max_chars:
+                break
+            leading.append(paragraph)
+            length += len(paragraph) + 1
+        return " ".join(leading)
+
     def extract_title(self, state: ProcessingState):
         """
         Extract the title of a document using a language model.
 
-        :param: state (ProcessingState): The current state containing the text to extract the title from.
+        :param: state (ProcessingState): The current state containing the paragraphs to extract the title from.
+            Only the leading paragraphs are read, as the title is expected at the start of the document.
 
         :returns: ProcessingState: Updated state with the extracted title stored in the 'title' field.
         """
         self.logger.info("Extracting document title.")
         try:
-            chain = (
-                PromptTemplate(
-                    input_variables=["text"],
-                    template=self.title_extraction_prompt,
-                )
-                | self.llm
-                | StrOutputParser()
-            )
-
-            state["title"] = chain.invoke(
-                {"text": state["text"][: min(len(state["text"]), 2000)]}
+            state["title"] = self.title_chain.invoke(
+                {
+                    "text": truncate_to_tokens(
+                        self._leading_text(
+                            state["paragraphs"],
+                            _TITLE_CONTEXT_TOKENS * _MAX_CHARS_PER_TOKEN,
+                        ),
+                        _TITLE_CONTEXT_TOKENS,
+                    )
+                }
             ).strip()
-            self.logger.info(f"Extracted title: {state['title']}")
+            self.logger.info("Extracted title: %s", state["title"])
         except Exception as e:
             self.logger.error(f"Error extracting title: {e}")
             raise
@@ -385,6 +585,8 @@ class LangChainRetriever(DocumentInformationRetrieval):
         self.answer_prompt = None
         self.title_extraction_prompt = None
         self.n_chunk_results = None
+        self.max_context_tokens = None
+        self.embeddings_cache_quantization = "float16"
         self.workflow_manager = None
         self.workflow = None
 
@@ -403,6 +605,8 @@ class LangChainRetriever(DocumentInformationRetrieval):
             query_expansion_prompt=self.query_expansion_prompt,
             title_extraction_prompt=self.title_extraction_prompt,
             has_title=self.document_name != "",
+            max_context_tokens=self.max_context_tokens,
+            embeddings_cache_quantization=self.embeddings_cache_quantization,
         )
         self.workflow = self.workflow_manager.setup_workflow()
         return self
@@ -429,8 +633,20 @@ class LangChainRetriever(DocumentInformationRetrieval):
                 "This retriever dynamically generates queries; input queries are ignored."
             )
 
-        initial_state = {"text": " ".join(paragraphs)}
-        result = self.workflow.compile().invoke(initial_state)
+        initial_state = {"paragraphs": paragraphs}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The title only depends on the leading paragraphs, so its LLM call overlaps with the workflow
+            title_future = (
+                None
+                if self.workflow_manager.has_title
+                else executor.submit(
+                    self.workflow_manager.extract_title,
+                    {"paragraphs": paragraphs},
+                )
+            )
+            result = self.workflow_manager.run(self.workflow, initial_state)
+            if title_future is not None:
+                result["title"] = title_future.result()["title"]
         return result.get(
             "formatted_dialog", "No dialog generated"
         ), result.get("title", "Untitled Document")
@@ -0,0 +1,82 @@
+from typing import List, Optional
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class FlatVectorStore:
+    """
+    In-memory vector store holding L2-normalized embeddings in a single NumPy matrix.
+
+    The retrieval workflow only indexes the chunks of one document for the duration of a search, so an exact
+    search over a flat matrix (one matrix product for all the queries) is cheaper than building a
+    persistent ANN index.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        texts: List[str],
+        metadatas: Optional[List[dict]] = None,
+    ):
+        """
+        :param vectors: Matrix of shape (n_texts, dimensions) with the text embeddings
+        :param texts: Indexed texts
+        :param metadatas: Optional metadata for each text
+        """
+        self.vectors = self._normalize(vectors)
+        self.texts = texts
+        self.metadatas = metadatas or [{} for _ in texts]
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.size == 0:
+            # No texts, e.g. a document that yields no chunks. The array built from [] is 1-D
+            return vectors.reshape(0, 0)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+    ) -> "FlatVectorStore":
+        """
+        Embed the texts and build the store.
+
+        :param texts: Texts to index
+        :param embedding: Embeddings model used to embed the texts
+        :param metadatas: Optional metadata for each text
+        :return: FlatVectorStore
+        """
+        return cls(embedding.embed_documents(texts), texts, metadatas)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def search_ids_by_vectors(
+        self, query_vectors: List[List[float]], k: int
+    ) -> List[List[int]]:
+        """
+        Retrieve the ids (row positions) of the k most similar texts (cosine similarity) for each of the query
+        vectors.
+
+        :param query_vectors: Query embeddings
+        :param k: Number of results per query
+        :return: For each query, a list of ids sorted by decreasing similarity
+        """
+        k = min(k, len(self))
+        if k == 0 or not query_vectors:
+            return [[] for _ in query_vectors]
+
+        scores = self._normalize(query_vectors) @ self.vectors.T
+        top_k = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        # argpartition leaves the top k unordered
+        top_k_scores = np.take_along_axis(scores, top_k, axis=1)
+        top_k = np.take_along_axis(
+            top_k, np.argsort(-top_k_scores, axis=1), axis=1
+        )
+        return top_k.tolist()
@@ -2,6 +2,7 @@ import base64
 import io
 from abc import ABC, abstractmethod
 import pypdf
+import pypdfium2 as pdfium
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
@@ -47,6 +48,37 @@ class PyPDFExtractor(PDFExtractor):
         return text
 
 
+class PyPDFium2Extractor(PDFExtractor):
+    """Extracts text from PDF files using pypdfium2 (bindings to Google's PDFium), which is considerably
+    faster than pure Python extractors on large documents."""
+
+    def _extract_pages(self, pdf: pdfium.PdfDocument):
+        """Yields the text of each page, releasing the native page handles as it goes.
+
+        :param pdf: Opened PDFium document
+        :return: Generator of page texts
+        """
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range() + "\n"
+            finally:
+                textpage.close()
+                page.close()
+
+    def extract(self, pdf_bytes):
+        """Extracts text from a PDF file using pypdfium2.
+
+        :param pdf_bytes: PDF file content as bytes
+        :return: Extracted text as string
+        """
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return "".join(self._extract_pages(pdf))
+        finally:
+            pdf.close()
+
+
 class DoclingExtractor(PDFExtractor):
     """Extracts text from PDF files using Docling's DocumentConverter."""
 
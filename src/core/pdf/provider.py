@@ -1,10 +1,15 @@
 from enum import Enum
 import src.core.utils.functions as F
-from src.core.pdf.extractor import PyPDFExtractor, DoclingExtractor
+from src.core.pdf.extractor import (
+    PyPDFExtractor,
+    PyPDFium2Extractor,
+    DoclingExtractor,
+)
 
 
 class Provider(Enum):
     PYPDF = "pypdf"
+    PYPDFIUM2 = "pypdfium2"
     DOCLING = "docling"
 
 
@@ -18,6 +23,8 @@ class PDFExtractorProvider:
 
         if provider == Provider.PYPDF:
             return PyPDFExtractor()
+        if provider == Provider.PYPDFIUM2:
+            return PyPDFium2Extractor()
         if provider == Provider.DOCLING:
             return DoclingExtractor()
         else:
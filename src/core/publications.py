@@ -1,8 +1,11 @@
 import base64
 import datetime
 import logging
+import threading
 import uuid
-from typing import Optional, Iterator, Dict, Any
+from typing import Optional, Iterator, Dict, Any, List
+from bson.binary import Binary, USER_DEFINED_SUBTYPE
+from cachetools import LRUCache
 from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
@@ -20,6 +23,11 @@ from src.core.vault.hashicorp import VaultClient
 class PublicationIterator:
     """Iterator class for filtering and iterating through publications based on their state."""
 
+    _DECODED_IMAGES_CACHE_SIZE = 8  # Decoded images kept in memory (the bot goes back and forth between a few)
+    # Binary subtype marking images stored as raw bytes. Images stored by older versions, or inserted by the sources,
+    # are base64 encoded
+    _RAW_IMAGE_SUBTYPE = USER_DEFINED_SUBTYPE
+
     def __init__(
         self,
         state_filter: Optional[PublicationState] = None,
@@ -45,6 +53,10 @@ class PublicationIterator:
         self.current_index = 0
         self.format = do_format
         self._total_count = None  # Cache for total count
+        # Decoded images by (publication_id, last_updated). Any image update sets last_updated, so stale entries are
+        # never hit
+        self._decoded_images = LRUCache(maxsize=self._DECODED_IMAGES_CACHE_SIZE)
+        self._decoded_images_lock = threading.Lock()
 
     def _format(self, publication: dict) -> dict:
         """Format a publication dictionary by removing internal MongoDB ID and converting datetime fields to ISO format.
@@ -60,13 +72,42 @@ class PublicationIterator:
 
         if publication:
             publication.pop("_id", None)
+            if publication.get("image"):
+                publication["image"] = self._decode_image(publication)
             for key, value in publication.items():
                 if isinstance(value, datetime.datetime):
                     publication[key] = value.isoformat()
-                if key == "image" and publication[key]:
-                    publication[key] = base64.b64decode(publication[key])
         return publication
 
+    def _decode_image(self, publication: dict) -> bytes:
+        """Get the image bytes of a publication. Raw images are returned as is, base64 encoded ones are decoded, reusing
+        the result for repeated reads of the same image.
+
+        Args:
+            publication (dict): The publication document from MongoDB, with a non-empty image.
+
+        Returns:
+            bytes: The decoded image.
+        """
+        image = publication["image"]
+        if (
+            isinstance(image, Binary)
+            and image.subtype == self._RAW_IMAGE_SUBTYPE
+        ):
+            return image
+
+        key = (
+            publication.get("publication_id"),
+            publication.get("last_updated"),
+        )
+        with self._decoded_images_lock:
+            image = self._decoded_images.get(key)
+        if image is None:
+            image = base64.b64decode(publication["image"])
+            with self._decoded_images_lock:
+                self._decoded_images[key] = image
+        return image
+
     def remove(self, publication_id: str) -> bool:
         """Remove a publication by its ID.
 
@@ -102,7 +143,23 @@ class PublicationIterator:
         Returns:
             Optional[str]: The content of the publication.
         """
-        return self.get(publication_id).get("content")
+        return self.client.find_one(
+            {"publication_id": publication_id}, {"content": 1}
+        ).get("content")
+
+    def exists(self, publication_id: str) -> bool:
+        """Check whether a publication exists, without fetching it.
+
+        Args:
+            publication_id (str): The ID of the publication.
+
+        Returns:
+            bool: True if the publication exists, False otherwise.
+        """
+        return (
+            self.client.find_one({"publication_id": publication_id}, {"_id": 1})
+            is not None
+        )
 
     def get_image(self, publication_id: str) -> bytes:
         """Retrieve the image field of a specific publication.
@@ -113,8 +170,13 @@ class PublicationIterator:
         Returns:
             Optional[str]: The image of the publication.
         """
-        image = self.get(publication_id).get("image")
-        return base64.b64decode(image) if image else None
+        publication = self.client.find_one(
+            {"publication_id": publication_id},
+            {"publication_id": 1, "last_updated": 1, "image": 1},
+        )
+        if not publication or not publication.get("image"):
+            return None
+        return self._decode_image(publication)
 
     def reset_iterator(self) -> None:
         """Reset the iterator to the beginning of the results."""
@@ -184,8 +246,14 @@ class PublicationIterator:
         Returns:
             bool: True if the image was updated, False otherwise.
         """
+        # Stored as raw bytes, so reads don't have to decode it
         return self._update_publication(
-            publication_id, {"image": base64.b64encode(image).decode("utf-8")}
+            publication_id,
+            {
+                "image": (
+                    Binary(image, self._RAW_IMAGE_SUBTYPE) if image else None
+                )
+            },
         )
 
     def update_state(
@@ -250,31 +318,53 @@ class PublicationIterator:
         :returns: bool: True if the index was successfully updated, False otherwise.
         """
         self.reset_iterator()
-        for index, publication in enumerate(self._cursor):
-            if publication.get("publication_id") == publication_id:
-                self.current_index = index
-                self.logger.warning(
-                    f"Current index: {self.current_index} out of {len(self)}"
-                )
-                return True
+        # Locate the publication with an indexed count instead of scanning (and downloading) all the ones before it
+        state_filter = (
+            {"state": self.state_filter.value} if self.state_filter else {}
+        )
+        publication = self.client.find_one(
+            {"publication_id": publication_id, **state_filter},
+            {"creation_date": 1},
+        )
+        if not publication:
+            return False
+
+        self.current_index = self.client.count_documents(
+            {
+                **state_filter,
+                "creation_date": {"$lt": publication["creation_date"]},
+            }
+        )
+        # Leave the cursor right after the publication, as iterating up to it would
+        self._cursor = self._build_cursor().skip(self.current_index + 1)
+        self.logger.warning(
+            f"Current index: {self.current_index} out of {len(self)}"
+        )
+        return True
 
-        return False
+    def list(self, fields: Optional[List[str]] = None):
+        """List the publications matching the filter in a single query, along with their index.
 
-    def list(self):
-        result = []
-        tmp_cursor = self._build_cursor()
-        for index, publication in enumerate(tmp_cursor):
-            result.append((index, publication))
-        return result
+        :param: fields (Optional[List[str]]): Fields to fetch. If None, whole documents are fetched, which includes
+            the content and image of every publication.
 
-    def _build_cursor(self):
+        :returns: List[Tuple[int, Dict[str, Any]]]: (index, publication) pairs.
+        """
+        return list(enumerate(self._build_cursor(fields)))
+
+    def _build_cursor(self, fields: Optional[List[str]] = None):
         """
         It creates the cursor object with the state filter
+
+        :param: fields (Optional[List[str]]): Fields to fetch. If None, whole documents are fetched.
         """
         state_filter = (
             {"state": self.state_filter.value} if self.state_filter else {}
         )
-        return self.client.find(state_filter).sort("creation_date", 1)
+        projection = dict.fromkeys(fields, 1) if fields else None
+        return self.client.find(state_filter, projection).sort(
+            "creation_date", 1
+        )
 
     def __iter__(self) -> Iterator[Dict[str, Any]]:
         """Initialize the iterator for the publication results.
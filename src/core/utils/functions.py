@@ -1,4 +1,5 @@
 import base64
+import re
 from enum import Enum
 from typing import Type, Optional, Any
 import requests
@@ -83,6 +84,76 @@ def get_function_by_name(
     )
 
 
+# Compiled once at import time, as boldify_unicode runs on every generated publication
+_BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")
+_BOLD_TRANSLATION = str.maketrans(
+    {
+        "a": "\U0001d41a",
+        "b": "\U0001d41b",
+        "c": "\U0001d41c",
+        "d": "\U0001d41d",
+        "e": "\U0001d41e",
+        "f": "\U0001d41f",
+        "g": "\U0001d420",
+        "h": "\U0001d421",
+        "i": "\U0001d422",
+        "j": "\U0001d423",
+        "k": "\U0001d424",
+        "l": "\U0001d425",
+        "m": "\U0001d426",
+        "n": "\U0001d427",
+        "o": "\U0001d428",
+        "p": "\U0001d429",
+        "q": "\U0001d42a",
+        "r": "\U0001d42b",
+        "s": "\U0001d42c",
+        "t": "\U0001d42d",
+        "u": "\U0001d42e",
+        "v": "\U0001d42f",
+        "w": "\U0001d430",
+        "x": "\U0001d431",
+        "y": "\U0001d432",
+        "z": "\U0001d433",
+        "A": "\U0001d400",
+        "B": "\U0001d401",
+        "C": "\U0001d402",
+        "D": "\U0001d403",
+        "E": "\U0001d404",
+        "F": "\U0001d405",
+        "G": "\U0001d406",
+        "H": "\U0001d407",
+        "I": "\U0001d408",
+        "J": "\U0001d409",
+        "K": "\U0001d40a",
+        "L": "\U0001d40b",
+        "M": "\U0001d40c",
+        "N": "\U0001d40d",
+        "O": "\U0001d40e",
+        "P": "\U0001d40f",
+        "Q": "\U0001d410",
+        "R": "\U0001d411",
+        "S": "\U0001d412",
+        "T": "\U0001d413",
+        "U": "\U0001d414",
+        "V": "\U0001d415",
+        "W": "\U0001d416",
+        "X": "\U0001d417",
+        "Y": "\U0001d418",
+        "Z": "\U0001d419",
+        "0": "\U0001d7ce",
+        "1": "\U0001d7cf",
+        "2": "\U0001d7d0",
+        "3": "\U0001d7d1",
+        "4": "\U0001d7d2",
+        "5": "\U0001d7d3",
+        "6": "\U0001d7d4",
+        "7": "\U0001d7d5",
+        "8": "\U0001d7d6",
+        "9": "\U0001d7d7",
+    }
+)
+
+
 def boldify_unicode(text: str) -> str:
     """
     Converts text enclosed within `**` to Unicode bold characters.
@@ -91,76 +162,6 @@ def boldify_unicode(text: str) -> str:
 
     :returns: str: The input string with text within `**` converted to Unicode bold characters.
     """
-    import re
-
-    def to_unicode_bold(s: str) -> str:
-        bold_chars = {
-            "a": "\U0001d41a",
-            "b": "\U0001d41b",
-            "c": "\U0001d41c",
-            "d": "\U0001d41d",
-            "e": "\U0001d41e",
-            "f": "\U0001d41f",
-            "g": "\U0001d420",
-            "h": "\U0001d421",
-            "i": "\U0001d422",
-            "j": "\U0001d423",
-            "k": "\U0001d424",
-            "l": "\U0001d425",
-            "m": "\U0001d426",
-            "n": "\U0001d427",
-            "o": "\U0001d428",
-            "p": "\U0001d429",
-            "q": "\U0001d42a",
-            "r": "\U0001d42b",
-            "s": "\U0001d42c",
-            "t": "\U0001d42d",
-            "u": "\U0001d42e",
-            "v": "\U0001d42f",
-            "w": "\U0001d430",
-            "x": "\U0001d431",
-            "y": "\U0001d432",
-            "z": "\U0001d433",
-            "A": "\U0001d400",
-            "B": "\U0001d401",
-            "C": "\U0001d402",
-            "D": "\U0001d403",
-            "E": "\U0001d404",
-            "F": "\U0001d405",
-            "G": "\U0001d406",
-            "H": "\U0001d407",
-            "I": "\U0001d408",
-            "J": "\U0001d409",
-            "K": "\U0001d40a",
-            "L": "\U0001d40b",
-            "M": "\U0001d40c",
-            "N": "\U0001d40d",
-            "O": "\U0001d40e",
-            "P": "\U0001d40f",
-            "Q": "\U0001d410",
-            "R": "\U0001d411",
-            "S": "\U0001d412",
-            "T": "\U0001d413",
-            "U": "\U0001d414",
-            "V": "\U0001d415",
-            "W": "\U0001d416",
-            "X": "\U0001d417",
-            "Y": "\U0001d418",
-            "Z": "\U0001d419",
-            "0": "\U0001d7ce",
-            "1": "\U0001d7cf",
-            "2": "\U0001d7d0",
-            "3": "\U0001d7d1",
-            "4": "\U0001d7d2",
-            "5": "\U0001d7d3",
-            "6": "\U0001d7d4",
-            "7": "\U0001d7d5",
-            "8": "\U0001d7d6",
-            "9": "\U0001d7d7",
-        }
-        return "".join(bold_chars.get(char, char) for char in s)
-
-    def replacer(match: re.Match) -> str:
-        return to_unicode_bold(match.group(1))
-
-    return re.sub(r"\*\*(.*?)\*\*", replacer, text)
+    return _BOLD_PATTERN.sub(
+        lambda match: match.group(1).translate(_BOLD_TRANSLATION), text
+    )
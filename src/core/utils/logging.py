@@ -1,7 +1,12 @@
+import atexit
 import logging
+import multiprocessing
 import os
+import queue
 import sys
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from src.core.constants import (
     LINKEDIN_ASSISTANT_LOGGING_LEVEL,
     LOGGING_DIR,
@@ -19,7 +24,12 @@ class TruncateByTimeHandler(logging.FileHandler):
         return cls._instances[filename]
 
     def __init__(
-        self, filename, mode="a", encoding="utf-8", interval_seconds=3600
+        self,
+        filename,
+        mode="a",
+        encoding="utf-8",
+        interval_seconds=3600,
+        defer_flush=False,
     ):
         """
         Initializes the custom logging handler.
@@ -28,8 +38,11 @@ class TruncateByTimeHandler(logging.FileHandler):
         :param: mode: File mode (default is append 'a').
         :param: encoding: File encoding (default is 'utf-8').
         :param: interval_seconds: Time interval (in seconds) after which the log file will be truncated.
+        :param: defer_flush: If True, records are only written to the stream buffer, and flushing is left to the
+            caller (see FlushOnIdleQueueListener). Otherwise, the file is flushed after every record.
         """
         super().__init__(filename=filename, mode=mode, encoding=encoding)
+        self.defer_flush = defer_flush
         self.interval_seconds = (
             interval_seconds  # Interval for truncating the log file.
         )
@@ -43,7 +56,17 @@ class TruncateByTimeHandler(logging.FileHandler):
 
         :param: record: The log record to write.
         """
-        super().emit(record)  # Write the log record to the file.
+        if self.defer_flush:
+            if self.stream is None:
+                self.stream = self._open()
+            try:
+                self.stream.write(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        else:
+            super().emit(record)  # Write the log record to the file.
         current_time = time.time()  # Get the current time.
 
         # Check if the interval since the last truncation has passed.
@@ -57,12 +80,102 @@ class TruncateByTimeHandler(logging.FileHandler):
         """
         Truncates the log file to clear its contents.
         """
+        self.flush()  # Buffered records would otherwise be written after the truncation
         with open(
             self.baseFilename, "r+"
         ) as file:  # Open the file in read/write mode.
             file.truncate()  # Clear the contents of the file.
 
 
+class FlushOnIdleQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers only once the queue is drained, instead of after every record. A burst of
+    records costs a single write syscall, and nothing stays buffered while the logger is idle.
+    """
+
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+    def stop(self):
+        if self._thread is None:  # Already stopped
+            return
+        super().stop()
+        # The records drained right before the sentinel are still buffered
+        for handler in self.handlers:
+            handler.flush()
+
+
+_queue_handlers: dict[str, QueueHandler] = {}
+_queue_listeners: list[QueueListener] = []
+_queue_handlers_lock = threading.Lock()
+
+
+def get_queue_file_handler(
+    filename: str, log_level: int, formatter: str
+) -> QueueHandler:
+    """
+    Get the handler that writes to a log file through a queue. Records are only enqueued by the logging thread, a
+    single QueueListener thread per file drains the queue and does the actual (blocking) file writes.
+
+    :param filename: Path of the log file.
+    :param log_level: Minimum level of the records written to the file.
+    :param formatter: Format of the records written to the file.
+    :return: QueueHandler feeding the file.
+    """
+    with _queue_handlers_lock:
+        if filename not in _queue_handlers:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            filehandler = TruncateByTimeHandler(
+                filename=filename,
+                encoding="utf-8",
+                mode="a+",
+                defer_flush=True,
+            )
+            filehandler.setLevel(log_level)
+            filehandler.setFormatter(logging.Formatter(formatter))
+            log_queue = queue.SimpleQueue()
+            listener = FlushOnIdleQueueListener(
+                log_queue, filehandler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)  # Flushes the pending records
+            _queue_listeners.append(listener)
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(log_level)
+            _queue_handlers[filename] = queue_handler
+        return _queue_handlers[filename]
+
+
+def stop_queue_listeners() -> None:
+    """
+    Stop the listeners of the log files, writing their pending records. atexit does it when the interpreter exits,
+    but multiprocessing child processes exit through os._exit, so their task has to call it before returning.
+    """
+    with _queue_handlers_lock:
+        for listener in _queue_listeners:
+            listener.stop()
+
+
+def get_log_dir() -> str:
+    """
+    Directory of the log files of the current process. Child processes (such as the sources handler) write to a
+    subdirectory named after the process: sharing the files of the main process, their buffered writes would tear
+    each other's lines, and each process would truncate the files under the other.
+
+    The process name is set by multiprocessing before a spawned child imports any module, so it is already right
+    for the loggers created at import time.
+
+    :return: Path of the directory.
+    """
+    process_name = multiprocessing.current_process().name
+    if process_name == "MainProcess":
+        return LOGGING_DIR
+    return os.path.join(LOGGING_DIR, process_name)
+
+
 class ServiceLogger(logging.Logger):
     """
     A utility class for providing a thread-specific logger.
@@ -92,15 +205,13 @@ class ServiceLogger(logging.Logger):
 
     def _init_file_handler(self, log_level):
         try:
-            os.makedirs(LOGGING_DIR, exist_ok=True)
-            filehandler = TruncateByTimeHandler(
-                filename=os.path.join(LOGGING_DIR, f"{self.filename}.log"),
-                encoding="utf-8",
-                mode="a+",
+            self.addHandler(
+                get_queue_file_handler(
+                    os.path.join(get_log_dir(), f"{self.filename}.log"),
+                    log_level,
+                    self.formatter,
+                )
             )
-            filehandler.setLevel(log_level)
-            filehandler.setFormatter(logging.Formatter(self.formatter))
-            self.addHandler(filehandler)
 
         except OSError as ex:
             self.error(f"Error adding handler to file {ex}")
@@ -46,7 +46,7 @@ class PublicationsHandler:
         logger.info("Initializing publications handler")
         try:
             while not stop_event or not stop_event.is_set():
-                logger.debug(f"Handler active state: {self.active}")
+                logger.debug("Handler active state: %s", self.active)
                 if self.active:
                     logger.debug("Processing publication ideas")
                     self.process_publication_ideas()  # Process drafts if the handler is active
@@ -136,7 +136,7 @@ class PublicationsHandler:
             self.__setattr__(
                 key, config[key]
             )  # Dynamically assign configuration values to class attributes
-            logger.debug(f"Config key {key} set to {config[key]}")
+            logger.debug("Config key %s set to %s", key, config[key])
 
 
 def run(stop_event: threading.Event = None):
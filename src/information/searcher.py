@@ -9,7 +9,7 @@ from src.core.exceptions import OutOfTimeExecutionError
 from src.core.file_manager.b2 import B2Handler
 from src.core.publications import PublicationIterator
 import src.core.utils.functions as F
-from src.core.utils.logging import ServiceLogger
+from src.core.utils.logging import ServiceLogger, stop_queue_listeners
 from src.information.sources.base import InformationSource
 from src.information.sources.provider import ContentSearchEngineProvider
 
@@ -174,7 +174,7 @@ class SourcesHandler:
         :param search_engine: The search engine instance to execute.
         """
         try:
-            logger.debug(f"Running search engine {search_engine}")
+            logger.debug("Running search engine %s", search_engine)
             results = search_engine.search(
                 self.save_material if self.one_by_one else None, stop_event
             )
@@ -184,7 +184,7 @@ class SourcesHandler:
                 )  # Filter results if needed
                 for result in results:
                     self.save_material(result)  # Save each result
-            logger.debug(f"Finished running search engine {search_engine}")
+            logger.debug("Finished running search engine %s", search_engine)
         except OutOfTimeExecutionError:
             logger.info(
                 f"Search engine {search_engine} is not yet meant to execute."
@@ -272,8 +272,12 @@ def run(stop_event: threading.Event = None):
     """
     Entry point to start the SourcesHandler.
     """
-    SourcesHandler().run(stop_event)
-    logger.info("Exiting Run function")
+    try:
+        SourcesHandler().run(stop_event)
+        logger.info("Exiting Run function")
+    finally:
+        # main runs this in a child process, which exits without running atexit
+        stop_queue_listeners()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import json
+import multiprocessing
 import os
 import sys
 import threading
@@ -19,6 +20,15 @@ This main file is used to run all the servers at the same time. It is used to ru
 source handler and the auth server at the same time. The idea is that the Windows service will run this file
 """
 
+SHUTDOWN_TIMEOUT = 10  # Seconds all the tasks have, together, to stop after the stop event is set
+SUPERVISION_INTERVAL = (
+    30  # Seconds between checks that every task is still running
+)
+# The sources handler process is spawned on every platform, as the Windows service has to, so that it never inherits
+# the threads, locks or open log files of the main process
+_PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+_auth_server_started = False  # The auth server is started once per process
+
 
 def init():
     logger.info("Initializing LinkedInAssistant")
@@ -59,41 +69,105 @@ def start_auth_server():
 
 
     """
+    global _auth_server_started
+    if _auth_server_started:
+        # The Windows service calls run again after a task failure, the server from the first run is still serving
+        return
     logger.info("Starting aut server")
     threading.Thread(name="auth_server", target=auth_server.run).start()
+    _auth_server_started = True
+
+
+def _stop_workers(task_workers: list) -> None:
+    """
+    Wait for the tasks to stop once their stop events are set, and terminate the processes that did not.
+
+    :param task_workers: Threads and processes running the tasks.
+    """
+    logger.info("Waiting for tasks to stop")
+    # The tasks stop concurrently, so a single deadline bounds the whole shutdown by the slowest one
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    for worker in task_workers:
+        worker.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    for worker in task_workers:
+        if not worker.is_alive():
+            continue
+        if not isinstance(worker, threading.Thread):
+            logger.warning(f"Process {worker.name} did not stop, terminating")
+            worker.terminate()
+        else:
+            logger.warning(
+                f"Thread {worker.name} did not stop within {SHUTDOWN_TIMEOUT} seconds"
+            )
 
 
 def run(stop_event: Event) -> None:
     """
-    Run all tasks in separate threads and manage their lifecycle.
+    Run all tasks and manage their lifecycle.
+
+    The sources handler parses PDFs and splits and embeds documents, which is CPU bound, so it runs in its own process
+    to not compete for the GIL with the other tasks. The publications handler and the bot mostly wait on the network,
+    so they run in threads.
+
+    While waiting for the stop event, the tasks are supervised: if any of them dies, the others are stopped too and
+    an exception is raised, so that the caller (the Windows service) can restart them all instead of running with a
+    dead task.
 
     :param stop_event: An event used to signal when to stop all tasks.
+    :raise RuntimeError: If a task stopped before the stop event was set.
     """
     init()
     start_auth_server()
+    # The tasks get their own stop events, so they can be stopped on a task failure without stopping the caller.
+    # Processes can't share a threading.Event, so they are signalled through a multiprocessing one
+    thread_stop_event = threading.Event()
+    process_stop_event = _PROCESS_CONTEXT.Event()
     tasks = [
-        ("publications_handler", publications_handler.run),
-        ("sources_handler", source_handler.run),
-        ("bot", bot.run),
+        ("publications_handler", publications_handler.run, threading.Thread),
+        ("sources_handler", source_handler.run, _PROCESS_CONTEXT.Process),
+        ("bot", bot.run, threading.Thread),
     ]
-    task_threads = []
-    for task_name, task_function in tasks:
-        thread = threading.Thread(
+    task_workers = []
+    for task_name, task_function, worker_class in tasks:
+        worker = worker_class(
             name=task_name,
             target=task_function,
-            kwargs={"stop_event": stop_event},
+            kwargs={
+                "stop_event": (
+                    thread_stop_event
+                    if worker_class is threading.Thread
+                    else process_stop_event
+                )
+            },
+            daemon=worker_class is not threading.Thread,
         )
-        task_threads.append(thread)
-        thread.start()
-
-    while not stop_event.is_set():
-        time.sleep(2)
+        task_workers.append(worker)
+        worker.start()
 
-    logger.info("Waiting for threads to stop")
-    for thread in task_threads:
-        thread.join(timeout=5)
+    dead_workers = []
+    try:
+        while not stop_event.wait(timeout=SUPERVISION_INTERVAL):
+            dead_workers = [
+                worker for worker in task_workers if not worker.is_alive()
+            ]
+            if dead_workers:
+                logger.error(
+                    f"Tasks {[worker.name for worker in dead_workers]} stopped unexpectedly, stopping all tasks"
+                )
+                break
+    finally:
+        # Also on a KeyboardInterrupt in the wait, otherwise the non-daemon task threads keep the process alive
+        thread_stop_event.set()
+        process_stop_event.set()
+        _stop_workers(task_workers)
+
+    if dead_workers:
+        raise RuntimeError(
+            f"Tasks {[worker.name for worker in dead_workers]} stopped unexpectedly"
+        )
 
-    logger.info("All threads stopped, exiting")
+    logger.info("All tasks stopped, exiting")
     sys.exit()
 
 
@@ -1,6 +1,5 @@
 import re
 import sys
-import time
 from functools import wraps
 from hvac.exceptions import InvalidPath
 from origamibot.listener import Listener
@@ -18,11 +17,14 @@ from src.information.sources.rapid.youtube.pool import YoutubeUrlPool
 from src.linkedin.publisher import LinkedinPublisher
 from pyngrok import ngrok
 import requests
+from requests.adapters import HTTPAdapter
 from src.core.llm.conversation.agent import LangChainGPT
 import io
 import datetime
 import threading
-from typing import Optional
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Optional
 import src.core.utils.functions as F
 from src.telegram.constants import (
     MSG_START,
@@ -60,11 +62,15 @@ from src.telegram.constants import (
 
 
 logger = ServiceLogger(__name__)
+_YOUTUBE_URL_PATTERN = re.compile(
+    r"^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$"
+)
 
 
 def stateful(func):
     """
-    Decorator to update the config file after a function is called.
+    Decorator to update the config file after a function is called. Only the state attributes whose value differs
+    from the last persisted one are written, and nothing is written (nor read) if none changed.
     :param func:  function to decorate
     :return:  decorated function
     """
@@ -73,14 +79,18 @@ def stateful(func):
     @wraps(func)
     def update_config(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
-        config = self.config_client.load_config(CONFIG_SCHEMA)
 
         with self.mutex:
-            for key in config.keys():
-                if key in self.__dict__.keys():
-                    config[key] = getattr(self, key)
+            changes = {
+                key: getattr(self, key)
+                for key, value in self.persisted_config.items()
+                if getattr(self, key) != value
+            }
 
-        self.config_client.save_config(CONFIG_SCHEMA, config)
+        # save_config $sets the given keys, so the rest of the config is left untouched
+        if changes and self.config_client.save_config(CONFIG_SCHEMA, changes):
+            with self.mutex:
+                self.persisted_config.update(changes)
 
         return result
 
@@ -111,6 +121,7 @@ def restricted(func):
 
 class OrigamiBotExtended(OrigamiBot):
     _REQUEST_TIMEOUT = 10  # Timeout duration for HTTP requests, in seconds.
+    _MAX_PARALLEL_TRANSFERS = 10  # Maximum number of file transfers in flight
 
     def __init__(self, token: str):
         """
@@ -121,6 +132,18 @@ class OrigamiBotExtended(OrigamiBot):
         """
         super().__init__(token)
         self.file_manager = B2Handler()
+        # getFile and the download go back to back to the same host, a session reuses the TLS connection
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4, pool_maxsize=self._MAX_PARALLEL_TRANSFERS
+            ),
+        )
+        self._transfer_executor = ThreadPoolExecutor(
+            max_workers=self._MAX_PARALLEL_TRANSFERS,
+            thread_name_prefix="telegram_transfer",
+        )
 
     def _get_file_path(self, file_id: str) -> str:
         """
@@ -136,7 +159,7 @@ class OrigamiBotExtended(OrigamiBot):
             FetchFileException: If the API response indicates an error.
         """
         url = f"https://api.telegram.org/bot{self.token}/getFile?file_id={file_id}"
-        response = requests.get(url, timeout=self._REQUEST_TIMEOUT)
+        response = self._session.get(url, timeout=self._REQUEST_TIMEOUT)
         result = response.json()
         if result["ok"]:
             return result["result"]["file_path"]
@@ -157,7 +180,7 @@ class OrigamiBotExtended(OrigamiBot):
             DownloadFileException: If the download fails.
         """
         url = f"https://api.telegram.org/file/bot{self.token}/{file_path}"
-        response = requests.get(url, timeout=self._REQUEST_TIMEOUT)
+        response = self._session.get(url, timeout=self._REQUEST_TIMEOUT)
         if response.status_code == 200:
             return response.content
         else:
@@ -200,6 +223,22 @@ class OrigamiBotExtended(OrigamiBot):
             )
         return None
 
+    def process_pdf_async(self, document: Document, save_folder: str) -> Future:
+        """
+        Process a PDF document in the background, so the caller can go on handling messages while it is
+        downloaded and uploaded. At most _MAX_PARALLEL_TRANSFERS transfers run at the same time, the rest are queued.
+
+        Args:
+            document (Document): The document object representing the PDF.
+            save_folder (str): The folder where the PDF should be saved.
+
+        Returns:
+            Future: Resolves to the result of process_pdf.
+        """
+        return self._transfer_executor.submit(
+            self.process_pdf, document, save_folder
+        )
+
     def process_image(self, image: Document) -> bytes:
         """
         Process an image file by encoding it in base64.
@@ -213,6 +252,30 @@ class OrigamiBotExtended(OrigamiBot):
         file_bytes = self.get_file(image)
         return file_bytes
 
+    def process_image_async(self, image: Document) -> Future:
+        """
+        Process an image in the background, sharing the transfer limit with process_pdf_async.
+
+        Args:
+            image (Document): The image object to process.
+
+        Returns:
+            Future: Resolves to the result of process_image.
+        """
+        return self._transfer_executor.submit(self.process_image, image)
+
+    def download_stored_files(self, paths: List[str]) -> Iterator[bytes]:
+        """
+        Download files from the file storage in parallel, sharing the transfer limit with the Telegram transfers.
+
+        Args:
+            paths (List[str]): Paths of the files in the file storage.
+
+        Returns:
+            Iterator[bytes]: The content of each file, in the same order as the paths, as soon as it is available.
+        """
+        return self._transfer_executor.map(self.file_manager.download, paths)
+
     def send_publication(self, chat_id: int, publication: dict) -> None:
         """
         Send a publication (message and optional image) to a specific chat.
@@ -235,7 +298,11 @@ class BotState:
     the updated state.
     """
 
-    def __init__(self):
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Args:
+            config (Optional[dict]): Bot config, if it was already loaded. Otherwise, it is loaded from the database.
+        """
         self.cool_off_time: Optional[str] = None
         self.suggestion_period: Optional[int] = None
         self.chat_id: Optional[int] = None
@@ -243,16 +310,27 @@ class BotState:
         self.conversation_id = None
         self.publications_manager = Optional[PublicationIterator]
         self.llm_agent = LangChainGPT(logger=logger)
+        # Guards the snapshot of the state taken by @stateful and compound updates of several fields. Single attribute
+        # reads and writes are atomic, so they are not locked
         self.mutex = threading.Lock()
+        # Guards switching and clearing the agent's conversation (thread id and memory). LLM calls only snapshot the
+        # conversation under it, they are serialized inside the agent
+        self.agent_lock = threading.RLock()
+        # Set on state changes that may allow proposing a new suggestion, to wake up the suggestions loop
+        self.wake = threading.Event()
         self.vault_client = VaultClient()
         self.config_client = ConfigManager()
 
-        logger.debug("Reloading config")
-        config = self.config_client.load_config(CONFIG_SCHEMA)
+        if config is None:
+            logger.debug("Reloading config")
+            config = self.config_client.load_config(CONFIG_SCHEMA)
 
-        for key in config.keys():
-            if key in self.__dict__.keys():
-                self.__setattr__(key, config[key])
+        # Last persisted value of every state attribute backed by the config, used by @stateful to write only changes
+        self.persisted_config = {
+            key: value for key, value in config.items() if key in self.__dict__
+        }
+        for key, value in self.persisted_config.items():
+            self.__setattr__(key, value)
 
         if self.conversation_id:
             self.llm_agent.conversation_id = self.conversation_id
@@ -273,8 +351,9 @@ class BotState:
 
     @stateful
     def set_conversation_id(self, conversation_id):
-        self.conversation_id = conversation_id
-        self.llm_agent.conversation_id = self.conversation_id
+        with self.agent_lock:
+            self.conversation_id = conversation_id
+            self.llm_agent.conversation_id = self.conversation_id
 
     @stateful
     def reset(self) -> None:
@@ -282,11 +361,14 @@ class BotState:
         Resets the state of the bot, clearing conversation memory and resetting key flags.
         """
         logger.info("Resetting state")
-        with self.mutex:
+        with self.agent_lock:
+            # Deleting the checkpoints goes to the database, so it runs before taking the state mutex
             self.llm_agent.memory.clear(self.llm_agent.conversation_id)
-            self.llm_agent.conversation_id = None
-            self.conversation_id = None
-            self.cool_off_time = None
+            with self.mutex:
+                self.llm_agent.conversation_id = None
+                self.conversation_id = None
+                self.cool_off_time = None
+        self.wake.set()
 
     @stateful
     def set_chat_id(self, chat_id: int) -> None:
@@ -297,11 +379,11 @@ class BotState:
             chat_id (int): The ID of the chat to associate with the bot.
         """
         logger.info("Setting chat id")
-        with self.mutex:
-            self.chat_id = chat_id
-            self.vault_client.create_or_update_secret(
-                SecretKeys.TELEGRAM_CHAT_ID, self.chat_id
-            )
+        self.chat_id = chat_id
+        self.vault_client.create_or_update_secret(
+            SecretKeys.TELEGRAM_CHAT_ID, chat_id
+        )
+        self.wake.set()
 
     def get_cool_off_time(self) -> Optional[str]:
         """
@@ -312,8 +394,7 @@ class BotState:
             are in cool-off stage
             or false otherwise
         """
-        with self.mutex:
-            return self.cool_off_time
+        return self.cool_off_time
 
     @stateful
     def set_cool_off_time(self) -> None:
@@ -325,8 +406,8 @@ class BotState:
             cool-off stage
             or false otherwise
         """
-        with self.mutex:
-            self.cool_off_time = datetime.datetime.now().isoformat()
+        self.cool_off_time = datetime.datetime.now().isoformat()
+        self.wake.set()  # The loop has to recompute when the cool-off time ends
 
     @stateful
     def release_cool_off_time(self) -> None:
@@ -338,8 +419,7 @@ class BotState:
             are in cool-off stage
             or false otherwise
         """
-        with self.mutex:
-            self.cool_off_time = None
+        self.cool_off_time = None
 
     def get_chat_id(self) -> Optional[int]:
         """
@@ -348,8 +428,7 @@ class BotState:
         Returns:
             Optional[int]: The current chat ID.
         """
-        with self.mutex:
-            return self.chat_id
+        return self.chat_id
 
 
 class BotsCommands:
@@ -384,6 +463,10 @@ class BotsCommands:
         "add_youtube": "Add a YouTube URL for transcript processing. E.g ''/add_youtube https://youtube...''",
         "update": "Updates the current publication with the last message sent by the bot",
     }
+    # The usage message is static, so it is built once
+    _HELP_MESSAGE = "\nUsage:\n" + "\n".join(
+        f"/{cmd} - {desc}" for cmd, desc in _COMMAND_DESCRIPTIONS.items()
+    )
 
     def __init__(
         self,
@@ -425,18 +508,24 @@ class BotsCommands:
         it will be split into multiple messages at the last space before the limit.
         """
 
-        while len(message) > self._MAX_MESSAGE_LENGTH:
+        # Walk the message with an index, instead of copying the rest of it after every chunk
+        start = 0
+        while len(message) - start > self._MAX_MESSAGE_LENGTH:
             # Last space before the limit
-            split_index = message.rfind(" ", 0, self._MAX_MESSAGE_LENGTH)
+            split_index = message.rfind(
+                " ", start, start + self._MAX_MESSAGE_LENGTH
+            )
 
             # If no space is found, split at the limit
             if split_index == -1:
-                split_index = self._MAX_MESSAGE_LENGTH
+                split_index = start + self._MAX_MESSAGE_LENGTH
 
-            self.bot.send_message(chat_id, message[:split_index])
-            message = message[split_index:].lstrip()
+            self.bot.send_message(chat_id, message[start:split_index])
+            start = split_index
+            while start < len(message) and message[start].isspace():
+                start += 1
 
-        self.bot.send_message(chat_id, message)
+        self.bot.send_message(chat_id, message[start:])
 
     def help(self, message: Message):
         """
@@ -445,15 +534,7 @@ class BotsCommands:
         :param message: The message object received from the chat.
         :return: None
         """
-
-        response = "\nUsage:\n" + "\n".join(
-            [
-                f"/{cmd} - {desc}"
-                for cmd, desc in self._COMMAND_DESCRIPTIONS.items()
-            ]
-        )
-
-        self.bot.send_message(self.state.chat_id, response)
+        self.bot.send_message(self.state.chat_id, self._HELP_MESSAGE)
 
     def update(self, message):
         """
@@ -531,17 +612,18 @@ class BotsCommands:
         """
         logger.info("List triggered")
         lista = [
-            f"{element[0]}: {element[1].get('title', '')}"
-            for element in self.state.publications_manager.list()
-            if element[1].get("title", "")
+            f"{index}: {publication['title']}"
+            for index, publication in self.state.publications_manager.list(
+                ["title"]
+            )
+            if publication.get("title")
         ]
         cant_show_all = len(lista) > self._MAX_LISTABLE
-        lista_shortened = lista[: min(self._MAX_LISTABLE, len(lista))]
-        if len(lista_shortened) > 0:
-            logger.info("Suggestions:\n\n%s", "\n".join(lista_shortened))
+        suggestions = "\n".join(lista[: self._MAX_LISTABLE])
+        if suggestions:
+            logger.info("Suggestions:\n\n%s", suggestions)
             self.bot.send_message(
-                self.state.chat_id,
-                "Suggestions:\n\n{}".format("\n".join(lista_shortened)),
+                self.state.chat_id, f"Suggestions:\n\n{suggestions}"
             )
             if cant_show_all:
                 self.bot.send_message(
@@ -762,23 +844,43 @@ class BotsCommands:
             self.bot.send_message(self.state.chat_id, MSG_IMAGE_NOT_PASSED)
         elif (
             not self.state.conversation_id
-            or not self.state.publications_manager.get(
+            or not self.state.publications_manager.exists(
                 self.state.conversation_id
             )
         ):
             self.bot.send_message(self.state.chat_id, MSG_CONV_ID_NOT_SET)
             return
         else:
-            encoded_bytes = self.bot.process_image(
-                message.photo[-1]
-            )  # version of highest resolution available
-            result = self.state.publications_manager.update_image(
-                self.state.conversation_id, encoded_bytes
+            # The download runs in the background, and the image goes to the publication the command was sent for
+            conversation_id = self.state.conversation_id
+            self.bot.process_image_async(
+                message.photo[-1]  # version of highest resolution available
+            ).add_done_callback(
+                lambda future: self._on_image_processed(future, conversation_id)
             )
-            self.bot.send_message(
-                self.state.chat_id,
-                MSG_IMAGE_RECEIVED_SUCCESS if result else MSG_ERROR,
+
+    def _on_image_processed(self, future: Future, publication_id: str):
+        """
+        Set a downloaded image as the image of a publication, and notify the user of the result.
+
+        :param future: Future returned by process_image_async
+        :param publication_id: Publication to set the image for
+        :return:
+        """
+        try:
+            image = future.result()
+            result = image is not None and (
+                self.state.publications_manager.update_image(
+                    publication_id, image
+                )
             )
+        except Exception as e:
+            logger.error(f"Error setting image: {e}")
+            result = False
+        self.bot.send_message(
+            self.state.chat_id,
+            MSG_IMAGE_RECEIVED_SUCCESS if result else MSG_ERROR,
+        )
 
     def images(self, message: Message):
         """
@@ -802,8 +904,10 @@ class BotsCommands:
             )
             return
 
-        for image in images:
-            image_bytes = self.bot.file_manager.download(image["path"])
+        # Each image is sent once it is downloaded, while the next ones are still downloading
+        for image_bytes in self.bot.download_stored_files(
+            [image["path"] for image in images]
+        ):
             self.bot.send_photo(self.state.chat_id, io.BytesIO(image_bytes))
 
     def add_youtube(self, message: Message, youtube_url: str):
@@ -816,10 +920,7 @@ class BotsCommands:
         """
         try:
             # Enhanced validation for YouTube URL
-            if not re.match(
-                r"^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$",
-                youtube_url,
-            ):
+            if not _YOUTUBE_URL_PATTERN.match(youtube_url):
                 self.bot.send_message(self.state.chat_id, MSG_INVALID_URL)
                 return
 
@@ -841,15 +942,16 @@ class MessageListener(Listener):
     They get added to the conversation thread and the response is sent back to the user.
     """
 
-    _commands = list(
-        filter(lambda x: not x.startswith("__"), BotsCommands.__dict__.keys())
+    # Public attributes of BotsCommands are the bot commands
+    _commands = frozenset(
+        name for name in BotsCommands.__dict__ if not name.startswith("_")
     )
 
     def __init__(self, bot, state):
         self.bot = bot
         self.state = state
 
-    def respond(self, chat_id, response):
+    def respond(self, chat_id, response, conversation_id=None):
         """
         This function standardizes response mechanism. Respond, and if there is an image ready for the user send it
         as well and set it as the publication image for the current suggestion.
@@ -857,19 +959,36 @@ class MessageListener(Listener):
         :param chat_id: chat to respond to. Even though right now this is trivial because it can be obtained from the
         state
         :param response: Text message from the bot to send to the user
+        :param conversation_id: Publication the response belongs to. Defaults to the current one
         :return:
         """
         self.bot.send_message(chat_id, response)
 
         if self.state.llm_agent.image:
             self.state.publications_manager.update_image(
-                self.state.conversation_id, self.state.llm_agent.image
+                conversation_id or self.state.conversation_id,
+                self.state.llm_agent.image,
             )
-            photo = io.BytesIO(self.state.llm_agent.image)
-            photo.seek(0)
-            self.bot.send_photo(chat_id, photo)
+            self.bot.send_photo(chat_id, io.BytesIO(self.state.llm_agent.image))
             self.state.llm_agent.image = None
 
+    def _on_pdf_processed(self, future: Future):
+        """
+        Notify the user of the result of a background PDF transfer.
+
+        :param future: Future returned by process_pdf_async
+        :return:
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error processing PDF: {e}")
+            result = None
+        self.bot.send_message(
+            self.state.chat_id,
+            MSG_FILE_RECEIVED_SUCCESS if result else MSG_ERROR,
+        )
+
     # This decorator here makes sure no unauthorized user gets access to any command or triggers a response
     @restricted
     def on_message(self, message: Message):
@@ -885,31 +1004,32 @@ class MessageListener(Listener):
             message.text = message.caption
 
         if message.text and message.text.startswith("/"):
-            if not message.text[1:].split(" ")[0] in self._commands:
+            if message.text[1:].partition(" ")[0] not in self._commands:
                 self.bot.send_message(self.state.chat_id, MSG_COMMAND_NOT_FOUND)
             return
 
         elif (
             message.document and message.document.mime_type == "application/pdf"
         ):
-            result = self.bot.process_pdf(
+            # The confirmation is sent once the transfer is done, without blocking the next messages
+            self.bot.process_pdf_async(
                 message.document, FileManagedFolders.INPUT_PDF_FOLDER
-            )
-            self.bot.send_message(
-                self.state.chat_id,
-                MSG_FILE_RECEIVED_SUCCESS if result else MSG_ERROR,
-            )
+            ).add_done_callback(self._on_pdf_processed)
             return
         elif message.photo:
             encoded_images.append(self.bot.process_image(message.photo[-1]))
 
-        # Prevent loading of suggestions and that kind of thing while the bot is processing the message
-        with self.state.mutex:
-            response = self.state.llm_agent.call(
-                message.text, images=encoded_images
-            )
+        # Only the conversation is read under the lock. The call itself runs unlocked, so suggestions can be loaded
+        # while the agent responds, and the response still goes to the conversation the message was sent to
+        with self.state.agent_lock:
+            if not self.state.llm_agent.conversation_id:
+                self.state.llm_agent.conversation_id = str(uuid.uuid4())
+            conversation_id = self.state.llm_agent.conversation_id
+        response = self.state.llm_agent.call(
+            message.text, images=encoded_images, conversation_id=conversation_id
+        )
 
-        self.respond(self.state.chat_id, response)
+        self.respond(self.state.chat_id, response, conversation_id)
 
     def on_command_failure(
         self, message: Message, err=None
@@ -944,10 +1064,17 @@ class TeleLinkedinBot:
     All of this is documented on the readthedocs page though.
     """
 
+    _IDLE_WAIT = 300  # Maximum seconds between checks for new suggestions
+    _RETRY_WAIT = (
+        30  # Seconds before sending again a suggestion that could not be sent
+    )
+
     def __init__(self):
 
         self.bot = None
         self.state = None
+        # Publication whose suggestion could not be sent because of a network error
+        self._unsent_publication_id = None
         self.vault_client = VaultClient()
         self.publisher = LinkedinPublisher()
         self.config_client = ConfigManager()
@@ -988,6 +1115,10 @@ class TeleLinkedinBot:
             logger.info("Exiting context manager normally.")
 
         if self.bot:
+            # The service may build a new bot in the same process, the old one must not keep polling nor hold threads
+            logger.info("Stopping bot polling")
+            self.bot.stop()
+            self.bot._transfer_executor.shutdown(wait=False)
             logger.info("Disconnecting ngrok")
             ngrok.disconnect(self.http_tunnel.public_url)
             logger.info("Killing ngrok")
@@ -996,19 +1127,28 @@ class TeleLinkedinBot:
             sys.exit()
 
     def reload_config(self):
-        """Reload the configuration."""
+        """Reload the configuration. The bot and its state are only built the first time, reloading does not restart
+        them."""
         logger.info("Reloading config")
         config = self.config_client.load_config(CONFIG_SCHEMA)
 
         logger.info("Setting attributes")
-        for key in config.keys():
-            if key in self.__dict__.keys():
-                self.__setattr__(key, config[key])
+        for key, value in config.items():
+            if key in self.__dict__:
+                self.__setattr__(key, value)
+
+        if self.bot is None:
+            self._start_bot(config)
 
+    def _start_bot(self, config: dict):
+        """Build the Telegram bot and its state, attach the listener and the commands, and start polling.
+
+        :param config: Bot config, to initialize the state without loading it again
+        """
         logger.info("Initializing bot")
         self.bot = OrigamiBotExtended(self.token)
         logger.info("Setting up state")
-        self.state = BotState()
+        self.state = BotState(config)
         self.state.auth_address = f"https://{self.domain}"
         logger.info("Attaching listener")
         self.bot.add_listener(MessageListener(self.bot, self.state))
@@ -1028,58 +1168,118 @@ class TeleLinkedinBot:
 
         :return: boolean: If new publications can be proposed to the user
         """
+        cool_off_end = self._cool_off_end()
         return not self.state.conversation_id and (
-            not self.state.cool_off_time
-            or (
-                datetime.datetime.now()
-                > (
-                    datetime.datetime.fromisoformat(self.state.cool_off_time)
-                    + datetime.timedelta(days=self.state.suggestion_period)
-                )
-            )
+            cool_off_end is None or datetime.datetime.now() > cool_off_end
         )
 
+    def _cool_off_end(self) -> Optional[datetime.datetime]:
+        """
+        When the cool-off time after the last publication ends.
+
+        :return: datetime: end of the cool-off time, or None if it is not running
+        """
+        if not self.state.cool_off_time:
+            return None
+        return datetime.datetime.fromisoformat(
+            self.state.cool_off_time
+        ) + datetime.timedelta(days=float(self.state.suggestion_period or 0))
+
+    def _seconds_until_next_check(self) -> float:
+        """
+        Time the suggestions loop can sleep if nothing wakes it up: until the cool-off time ends, if it is running,
+        and never longer than _IDLE_WAIT, so that new publications get proposed.
+
+        :return: float: seconds to wait
+        """
+        if self._unsent_publication_id:
+            return self._RETRY_WAIT
+        cool_off_end = self._cool_off_end()
+        if cool_off_end is not None:
+            remaining = (cool_off_end - datetime.datetime.now()).total_seconds()
+            # Once it has ended, there is nothing to wake up for earlier
+            if remaining > 0:
+                return min(remaining, self._IDLE_WAIT)
+        return self._IDLE_WAIT
+
+    def propose_suggestion(self):
+        """
+        Send the next suggestion to the user, if there is a chat and new suggestions can be proposed.
+        """
+        chat_id = self.state.get_chat_id()
+        if not chat_id:
+            logger.info("Chat ID not set, start the conversation first")
+            return
+
+        if not self.can_propose_new_suggestions():
+            return
+
+        logger.info("Proposing new suggestions")
+        self.state.release_cool_off_time()
+        current = None
+        try:
+            if self.state.conversation_id:
+                self.state.publications_manager.center_iterator(
+                    self.state.conversation_id
+                )
+            if self._unsent_publication_id:
+                # The iterator has already moved past it, so it is fetched directly. It is None if it was removed
+                current = self.state.publications_manager.get(
+                    self._unsent_publication_id
+                )
+                self._unsent_publication_id = None
+            if not current:
+                current = next(self.state.publications_manager, None)
+            if current:
+                logger.info("Sending next suggestion")
+                self.state.set_conversation_id(current["publication_id"])
+                self.bot.send_publication(chat_id, current)
+            else:
+                logger.info("No new suggestions for now")
+                self.bot.send_message(chat_id, MSG_NO_SUGGESTIONS)
+        except requests.RequestException as e:
+            # Telegram could not be reached, so reporting the error would fail as well. The conversation memory is
+            # kept, and the publication is sent again after _RETRY_WAIT seconds
+            logger.warning("Network error sending suggestion: %s", e)
+            if current:
+                self._unsent_publication_id = current["publication_id"]
+            self.state.set_conversation_id(None)
+        except Exception as e:
+            logger.error("Error sending suggestion: %s", e)
+            self.bot.send_message(chat_id, MSG_ERROR_SENDING.format(e))
+            self.state.reset()
+
     def run(self, stop_event: threading.Event = None):
         """
         Run the bot. This is used to run the bot. It will send a suggestion every suggestion_period days.
         The algorithm is as follows:
         1. Check if the bot has just published. If so, wait for suggestion_period days.
-        2. Check if suggestions are blocked. If so, wait for 5 minutes in order to check again
+        2. Check if suggestions are blocked. If so, wait until a state change wakes the loop up (see BotState.wake),
+        the cool-off time ends or _IDLE_WAIT seconds pass, in order to check again
         3. If suggestions are not blocked, update the suggestions and check if there are suggestions.
         4. If there are suggestions, send the current suggestion and block suggestions. Then the flow of the program
         is carried by the interaction with the user via Telegram.
 
         """
         logger.info("Starting bot")
-        while not stop_event or not stop_event.is_set():
-            time.sleep(5)
-            chat_id = self.state.get_chat_id()
-            if not chat_id:
-                logger.info("Chat ID not set, start the conversation first")
-                continue
-
-            if not self.can_propose_new_suggestions():
-                continue
-
-            logger.info("Proposing new suggestions")
-            self.state.release_cool_off_time()
-            try:
-                if self.state.conversation_id:
-                    self.state.publications_manager.center_iterator(
-                        self.state.conversation_id
-                    )
-                current = next(self.state.publications_manager, None)
-                if current:
-                    logger.info("Sending next suggestion")
-                    self.state.set_conversation_id(current["publication_id"])
-                    self.bot.send_publication(chat_id, current)
-                else:
-                    logger.info("No new suggestions for now")
-                    self.bot.send_message(chat_id, MSG_NO_SUGGESTIONS)
-            except Exception as e:
-                logger.error("Error sending suggestion: %s", e)
-                self.bot.send_message(chat_id, MSG_ERROR_SENDING.format(e))
-                self.state.reset()
+        if stop_event:
+            # Wake the loop up as soon as the stop is requested
+            threading.Thread(
+                name="bot_stop_watcher",
+                target=lambda: stop_event.wait() or self.state.wake.set(),
+                daemon=True,
+            ).start()
+
+        while True:
+            # Cleared before the stop check and the proposal, so that a wake up signalled during or after them cuts
+            # the next wait short instead of being lost
+            self.state.wake.clear()
+            if stop_event and stop_event.is_set():
+                break
+            self.propose_suggestion()
+            # Sleep until a state change (chat id set, publication cleared or published...), the end of the cool-off
+            # time, or the periodic check for new publications
+            self.state.wake.wait(timeout=self._seconds_until_next_check())
 
         logger.info("Bot loop exited because of stop event")
 
@@ -1,3 +1,12 @@
+import multiprocessing
+
+if __name__ == "__main__":
+    # The service is a PyInstaller executable, child processes are spawned by re-running it. This turns those runs
+    # into the child process instead of the service. It runs before importing src, so that the child creates its
+    # loggers once multiprocessing has named it (see get_log_dir)
+    multiprocessing.freeze_support()
+
+import random
 import threading
 import time
 from src.core.constants import SERVICE_NAME
@@ -27,10 +36,18 @@ class LinkedinAssistantService(win32serviceutil.ServiceFramework):
         :param args: Command-line arguments passed to the service.
         """
         win32serviceutil.ServiceFramework.__init__(self, args)
-        self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
+        # Manual-reset events, so they stay signaled for every wait
+        self.hWaitStop = win32event.CreateEvent(None, 1, 0, None)
+        self.hWorkerDone = win32event.CreateEvent(None, 1, 0, None)
         self.stop_signal = threading.Event()
-        self.retry_delay = 60  # Retry after 60 seconds on failure
-        self.max_retries = 10  # Maximum number of retries
+        # Seconds before the first retry, doubled on every failure
+        self.base_retry_delay = 5
+        self.max_retry_delay = 300  # Maximum seconds between retries
+        self.max_retries = 10  # Maximum number of consecutive retries
+        # A run that lasted this many seconds was healthy, so its failure starts a new series of retries
+        self.healthy_run_time = 3600
+        # Seconds SvcStop waits for the worker, within the time the SCM allows a stop to take
+        self.stop_timeout = 25
         self.worker_thread = None
 
     def GetAcceptedControls(self):
@@ -38,6 +55,18 @@ class LinkedinAssistantService(win32serviceutil.ServiceFramework):
         result |= win32service.SERVICE_ACCEPT_PRESHUTDOWN
         return result
 
+    def _retry_delay(self, retries: int) -> float:
+        """
+        Exponential backoff with jitter: transient failures are retried quickly, persistent ones less and less often.
+
+        :param retries: Number of failures so far
+        :return: Seconds to wait before the next retry
+        """
+        delay = min(
+            self.max_retry_delay, self.base_retry_delay * 2 ** (retries - 1)
+        )
+        return delay + random.uniform(0, 0.25 * delay)
+
     def run(self):
         """
         Run the LinkedIn Assistant service in a threaded environment.
@@ -49,27 +78,39 @@ class LinkedinAssistantService(win32serviceutil.ServiceFramework):
             Worker function to run the main logic of the service in a thread.
             """
             retries = 0
-            while not self.stop_signal.is_set() and retries < self.max_retries:
-                try:
-                    logger.info("Running Linkedin Assistant.")
-                    main.run(self.stop_signal)
-                except Exception as e:
-                    logger.error(f"Error in Linkedin Assistant: {e}")
-                    retries += 1
-                    if retries >= self.max_retries:
-                        logger.error(
-                            "Maximum retries reached. Exiting service."
-                        )
-                        break
-                    if not self.stop_signal.is_set():
+            try:
+                while (
+                    not self.stop_signal.is_set() and retries < self.max_retries
+                ):
+                    started = time.monotonic()
+                    try:
+                        logger.info("Running Linkedin Assistant.")
+                        main.run(self.stop_signal)
+                    except Exception as e:
+                        logger.error(f"Error in Linkedin Assistant: {e}")
+                        if time.monotonic() - started >= self.healthy_run_time:
+                            retries = 0
+                        retries += 1
+                        if retries >= self.max_retries:
+                            logger.error(
+                                "Maximum retries reached. Exiting service."
+                            )
+                            break
+                        delay = self._retry_delay(retries)
                         logger.info(
-                            f"Service will retry in {self.retry_delay} seconds "
+                            f"Service will retry in {delay:.0f} seconds "
                             f"(Attempt {retries}/{self.max_retries})..."
                         )
-                        time.sleep(self.retry_delay)
-
+                        # Returns as soon as the service is stopped
+                        if self.stop_signal.wait(delay):
+                            break
+            finally:
+                # Lets SvcDoRun return, and the service stop, if the worker exits on its own
+                win32event.SetEvent(self.hWorkerDone)
+
+        # Not a daemon, so the interpreter waits for the worker to finish logging its shutdown
         self.worker_thread = threading.Thread(
-            target=service_worker, daemon=True
+            target=service_worker, name="linkedin_assistant_worker"
         )
         self.worker_thread.start()
 
@@ -89,7 +130,15 @@ class LinkedinAssistantService(win32serviceutil.ServiceFramework):
 
             self.run()
 
-            win32event.WaitForSingleObject(self.hWaitStop, win32event.INFINITE)
+            # Returning reports the service as stopped, both when it is stopped and when the worker exits
+            result = win32event.WaitForMultipleObjects(
+                [self.hWaitStop, self.hWorkerDone], False, win32event.INFINITE
+            )
+            if (
+                result == win32event.WAIT_OBJECT_0 + 1
+                and not self.stop_signal.is_set()
+            ):
+                logger.error("Linkedin Assistant exited. Stopping service.")
         except Exception as e:
             logger.error(f"Service failed to run: {e}")
             self.cleanup()
@@ -104,12 +153,27 @@ class LinkedinAssistantService(win32serviceutil.ServiceFramework):
             self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
             # Signal all components to stop
             self.stop_signal.set()
-            win32event.SetEvent(self.hWaitStop)
             logger.info("Service stop requested.")
+            deadline = time.monotonic() + self.stop_timeout
+            while (
+                self.worker_thread
+                and self.worker_thread.is_alive()
+                and time.monotonic() < deadline
+            ):
+                # Report progress, so the SCM keeps waiting instead of killing the process
+                self.ReportServiceStatus(
+                    win32service.SERVICE_STOP_PENDING, waitHint=5000
+                )
+                self.worker_thread.join(timeout=4)
             if self.worker_thread and self.worker_thread.is_alive():
-                self.worker_thread.join()
+                logger.error(
+                    f"Linkedin Assistant did not stop in {self.stop_timeout} seconds."
+                )
         except Exception as e:
             logger.error(f"Error during service stop: {e}")
+        finally:
+            # SvcDoRun returns, and the service is reported as stopped, even if the worker did not stop in time
+            win32event.SetEvent(self.hWaitStop)
 
     def cleanup(self):
         """